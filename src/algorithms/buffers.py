@@ -0,0 +1,69 @@
+import sys
+from array import array
+
+# Packed inputs are array.array or memoryview objects of machine integers. They
+# are sorted in place (or into a preallocated `out` of the same type) and never
+# converted to a list of boxed ints.
+
+RAW_FORMATS = ("B", "b", "c")
+
+
+def is_packed(values) -> bool:
+    return isinstance(values, (array, memoryview))
+
+
+def as_int_buffer(values, typecode: str = "q"):
+    """Return `values` as something the sort engines can index.
+
+    Lists, arrays and typed memoryviews pass through unchanged. Raw bytes
+    (bytearray, mmap, or a byte-format memoryview) are viewed as packed
+    `typecode` integers without copying.
+    """
+    if isinstance(values, (list, array)):
+        return values
+    if isinstance(values, memoryview):
+        # Only untyped byte views are reinterpreted; an 'i' or 'd' view
+        # already indexes as its own values
+        return values.cast(typecode) if values.format in RAW_FORMATS else values
+    return memoryview(values).cast("B").cast(typecode)
+
+
+def allocate_like(values, n: int | None = None):
+    n = len(values) if n is None else n
+    if isinstance(values, array):
+        # Repeating a one-item array allocates once, with no temporary bytes copy
+        return array(values.typecode, [0]) * n
+    if isinstance(values, memoryview):
+        return memoryview(bytearray(n * values.itemsize)).cast(values.format)
+    return [0] * n
+
+
+def copy_values(values):
+    if isinstance(values, memoryview):
+        out = allocate_like(values)
+        out[:] = values
+        return out
+    if isinstance(values, array):
+        return values[:]
+    return values.copy()
+
+
+def packed_bytes(values) -> int:
+    if isinstance(values, memoryview):
+        return values.nbytes
+    if isinstance(values, array):
+        return sys.getsizeof(values)
+    return list_bytes(values)
+
+
+def list_bytes(values) -> int:
+    """Approximate size of the same values held as a list of Python ints."""
+    n = len(values)
+    if n == 0:
+        return sys.getsizeof([])
+    # Sample rather than walk every element; ints outside the small-int cache
+    # each cost a separate object.
+    step = max(1, n // 1000)
+    sample = [values[i] for i in range(0, n, step)]
+    per_item = sum(sys.getsizeof(v) if not -5 <= v <= 256 else 0 for v in sample) / len(sample)
+    return sys.getsizeof([None] * n) + int(per_item * n)
@@ -1,4 +1,17 @@
-def merge_sort(values):
+try:
+    from algorithms.buffers import allocate_like, as_int_buffer, is_packed
+except ModuleNotFoundError:  # run directly from the algorithms folder
+    from buffers import allocate_like, as_int_buffer, is_packed
+
+
+def merge_sort(values, out=None):
+    # Lists get a new sorted list back; packed buffers are sorted in place
+    # (or into `out`) without building any lists
+    if not isinstance(values, list):
+        values = as_int_buffer(values)
+    if is_packed(values):
+        return merge_sort_buffer(values, out)
+
     # If a sub-array is too small to sort then just return the value
     if len(values) <= 1:
         return values
@@ -41,6 +54,57 @@ def merge(left_array, right_array):
     return merged
 
 
+def merge_sort_buffer(values, out=None):
+    n = len(values)
+    target = values
+    if out is not None:
+        out[:] = values
+        target = out
+    if n <= 1:
+        return target
+
+    # Bottom-up merge sort, ping-ponging between the target and one scratch
+    # buffer of the same type
+    src = target
+    dst = allocate_like(target)
+    width = 1
+    while width < n:
+        for lo in range(0, n, 2 * width):
+            mid = min(lo + width, n)
+            hi = min(lo + 2 * width, n)
+            merge_runs(src, dst, lo, mid, hi)
+        src, dst = dst, src
+        width *= 2
+
+    if src is not target:
+        target[:] = src
+    return target
+
+
+def merge_runs(src, dst, lo, mid, hi):
+    # Merge src[lo:mid] and src[mid:hi] into dst[lo:hi]; ties take the left run
+    left_pos = lo
+    right_pos = mid
+    pos = lo
+
+    while left_pos < mid and right_pos < hi:
+        left = src[left_pos]
+        right = src[right_pos]
+
+        if left <= right:
+            dst[pos] = left
+            left_pos += 1
+        else:
+            dst[pos] = right
+            right_pos += 1
+        pos += 1
+
+    if left_pos < mid:
+        dst[pos:hi] = src[left_pos:mid]
+    elif right_pos < hi:
+        dst[pos:hi] = src[right_pos:hi]
+
+
 def read_numbers(filename):
     numbers = []
 
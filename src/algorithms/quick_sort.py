@@ -1,4 +1,19 @@
-def quick_sort(values):
+try:
+    from algorithms.buffers import as_int_buffer, is_packed
+except ModuleNotFoundError:  # run directly from the algorithms folder
+    from buffers import as_int_buffer, is_packed
+
+INSERTION_CUTOFF = 16
+
+
+def quick_sort(values, out=None):
+    # Lists get a new sorted list back; packed buffers are sorted in place
+    # (or into `out`) without building any lists
+    if not isinstance(values, list):
+        values = as_int_buffer(values)
+    if is_packed(values):
+        return quick_sort_buffer(values, out)
+
     if len(values) <= 1:
         return values
 
@@ -20,6 +35,56 @@ def quick_sort(values):
     return quick_sort(left) + middle + quick_sort(right)
 
 
+def quick_sort_buffer(values, out=None):
+    target = values
+    if out is not None:
+        out[:] = values
+        target = out
+
+    # In-place Hoare partitioning with an explicit stack instead of
+    # recursion. The smaller side is handled first so the stack stays
+    # O(log n) deep.
+    stack = [(0, len(target) - 1)]
+    while stack:
+        lo, hi = stack.pop()
+        if hi - lo < INSERTION_CUTOFF:
+            insertion_sort_range(target, lo, hi)
+            continue
+
+        pivot = target[(lo + hi) // 2]
+        i, j = lo, hi
+        while True:
+            while target[i] < pivot:
+                i += 1
+            while target[j] > pivot:
+                j -= 1
+            if i >= j:
+                break
+            target[i], target[j] = target[j], target[i]
+            i += 1
+            j -= 1
+
+        # everything in target[lo:j + 1] is <= pivot <= everything after it
+        if j - lo < hi - j - 1:
+            stack.append((j + 1, hi))
+            stack.append((lo, j))
+        else:
+            stack.append((lo, j))
+            stack.append((j + 1, hi))
+
+    return target
+
+
+def insertion_sort_range(values, lo, hi):
+    for i in range(lo + 1, hi + 1):
+        v = values[i]
+        j = i - 1
+        while j >= lo and values[j] > v:
+            values[j + 1] = values[j]
+            j -= 1
+        values[j + 1] = v
+
+
 def read_numbers(filename):
     numbers = []
 
@@ -0,0 +1,189 @@
+import ast
+import importlib
+import importlib.util
+import os
+from pathlib import Path
+
+PLUGINS_DIR = Path(__file__).resolve().parent.parent / "plugins"
+ENTRY_POINT_GROUP = "sorting_algorithms"
+
+# Scanning installed distributions costs tens of milliseconds, so entry point
+# discovery is opt-in: set SORTING_ENTRY_POINTS=1 to enable it.
+SCAN_ENTRY_POINTS = os.environ.get("SORTING_ENTRY_POINTS", "") not in ("", "0")
+
+# Algorithms are declared by id with their metadata and an import target.
+# "buffers" marks engines that sort array.array / memoryview inputs in place.
+# "in_place" / "memory" describe list inputs; "packed" overrides them for
+# packed inputs, where the sorted result is written back into the buffer.
+# Nothing is imported until load_algorithm() is called for that id.
+REGISTRY: dict[str, dict] = {
+    "tournament_sort": {
+        "name": "Tournament Sort",
+        "target": "algorithms.tournament_sort:tourney_sort",
+        "complexity": "O(n log n)",
+        "stable": True,
+        "in_place": False,
+        "memory": "O(n)",
+        "buffers": True,
+        "packed": {"in_place": True, "memory": "O(n)"},
+    },
+    "merge_sort": {
+        "name": "Merge Sort",
+        "target": "algorithms.merge_sort:merge_sort",
+        "complexity": "O(n log n)",
+        "stable": True,
+        "in_place": False,
+        "memory": "O(n)",
+        "buffers": True,
+        "packed": {"in_place": True, "memory": "O(n)"},
+    },
+    "quick_sort": {
+        "name": "Quick Sort",
+        "target": "algorithms.quick_sort:quick_sort",
+        "complexity": "O(n log n) average, O(n^2) worst",
+        "stable": False,
+        "in_place": False,
+        "memory": "O(n)",
+        "buffers": True,
+        "packed": {"in_place": True, "memory": "O(log n)"},
+    },
+}
+
+_loaded: dict[str, object] = {}
+_discovered = False
+
+
+def register_algorithm(
+    algo_id: str,
+    name: str,
+    target: str,
+    complexity: str = "unknown",
+    stable: bool | None = None,
+    in_place: bool | None = None,
+    memory: str = "unknown",
+    buffers: bool = False,
+    packed: dict | None = None,
+    path: str | None = None,
+) -> None:
+    if algo_id in REGISTRY:
+        raise ValueError(f"Algorithm already registered: {algo_id}")
+
+    REGISTRY[algo_id] = {
+        "name": name,
+        "target": target,
+        "complexity": complexity,
+        "stable": stable,
+        "in_place": in_place,
+        "memory": memory,
+        "buffers": buffers,
+    }
+    if packed is not None:
+        REGISTRY[algo_id]["packed"] = packed
+    if path is not None:
+        REGISTRY[algo_id]["path"] = path
+
+
+def _read_plugin_declaration(path: Path) -> dict | None:
+    # Plugins declare a module-level ALGORITHM = {...} literal. It is read with
+    # ast so discovering a plugin never executes (or imports) its code.
+    tree = ast.parse(path.read_text(), filename=str(path))
+    for node in tree.body:
+        if not isinstance(node, ast.Assign):
+            continue
+        for target in node.targets:
+            if isinstance(target, ast.Name) and target.id == "ALGORITHM":
+                return ast.literal_eval(node.value)
+    return None
+
+
+def discover_plugins(
+    plugins_dir: Path = PLUGINS_DIR,
+    scan_entry_points: bool = SCAN_ENTRY_POINTS,
+) -> list[str]:
+    found: list[str] = []
+
+    if plugins_dir.is_dir():
+        for path in sorted(plugins_dir.glob("*.py")):
+            if path.name.startswith("_"):
+                continue
+            # A broken plugin is skipped with a warning; everything imports
+            # this module, so one bad file must not take the tool down.
+            try:
+                decl = _read_plugin_declaration(path)
+                if decl is None:
+                    continue
+                if not isinstance(decl, dict) or not isinstance(decl.get("fn"), str):
+                    raise ValueError('ALGORITHM must be a dict literal with an "fn" name')
+                algo_id = decl.get("id", path.stem)
+                if algo_id in REGISTRY:
+                    continue
+                register_algorithm(
+                    algo_id,
+                    decl.get("name", algo_id),
+                    f"{path.stem}:{decl['fn']}",
+                    complexity=decl.get("complexity", "unknown"),
+                    stable=decl.get("stable"),
+                    in_place=decl.get("in_place"),
+                    memory=decl.get("memory", "unknown"),
+                    buffers=decl.get("buffers", False),
+                    packed=decl.get("packed"),
+                    path=str(path),
+                )
+            except (OSError, SyntaxError, ValueError, TypeError) as exc:
+                print(f"Warning: skipping plugin {path.name}: {exc}")
+                continue
+            found.append(algo_id)
+
+    if not scan_entry_points:
+        return found
+
+    # Installed packages can also expose algorithms through entry points,
+    # e.g. [project.entry-points.sorting_algorithms] fast_sort = "pkg.mod:fn"
+    from importlib.metadata import entry_points
+
+    for ep in entry_points(group=ENTRY_POINT_GROUP):
+        if ep.name in REGISTRY:
+            continue
+        module_name, _, fn_name = ep.value.partition(":")
+        if not module_name.strip() or not fn_name.strip():
+            print(f"Warning: skipping entry point {ep.name}: {ep.value!r} is not 'module:function'")
+            continue
+        register_algorithm(ep.name, ep.name.replace("_", " ").title(), ep.value)
+        found.append(ep.name)
+
+    return found
+
+
+def ensure_discovered() -> None:
+    global _discovered
+    if not _discovered:
+        _discovered = True
+        discover_plugins()
+
+
+def available_algorithms() -> dict[str, dict]:
+    ensure_discovered()
+    return REGISTRY
+
+
+def load_algorithm(algo_id: str):
+    if algo_id in _loaded:
+        return _loaded[algo_id]
+
+    ensure_discovered()
+    if algo_id not in REGISTRY:
+        raise KeyError(f"Unknown algorithm: {algo_id}")
+
+    info = REGISTRY[algo_id]
+    module_name, fn_name = info["target"].split(":")
+
+    if "path" in info:
+        spec = importlib.util.spec_from_file_location(f"plugins.{module_name}", info["path"])
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+    else:
+        module = importlib.import_module(module_name)
+
+    fn = getattr(module, fn_name)
+    _loaded[algo_id] = fn
+    return fn
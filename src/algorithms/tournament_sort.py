@@ -1,6 +1,17 @@
 import math
+from array import array as packed_array
+
+try:
+    from algorithms.buffers import allocate_like, as_int_buffer, is_packed
+except ModuleNotFoundError:  # run directly from the algorithms folder
+    from buffers import allocate_like, as_int_buffer, is_packed
+
+def tourney_sort(array, out=None): # takes in an array, outputs the array sorted from smallest to largest
+    if not isinstance(array, list):
+        array = as_int_buffer(array)
+    if is_packed(array):
+        return tourney_sort_buffer(array, out)
 
-def tourney_sort(array): # takes in an array, outputs the array sorted from smallest to largest
     output = [] # create return array
     n = len(array)
     tree_size = 1
@@ -27,3 +38,48 @@ def tourney_sort(array): # takes in an array, outputs the array sorted from smal
             tree[j] = min(tree[j * 2], tree[j * 2 + 1])
 
     return output
+
+
+def tourney_sort_buffer(array, out=None): # packed version: sorts into out (or back into array) without tuples
+    n = len(array)
+    output = out if out is not None else allocate_like(array)
+    tree_size = 1
+    while tree_size < n:
+        tree_size *= 2
+
+    # the tree holds indices into array instead of (value, index) tuples. -1 plays the role of infinity
+    tree = packed_array('q', [-1]) * (tree_size * 2)
+
+    for i in range(n):
+        tree[tree_size + i] = i
+
+    for i in range(tree_size - 1, 0, -1):
+        tree[i] = play_match(array, tree[i * 2], tree[i * 2 + 1])
+
+    for i in range(n):
+        winner = tree[1]
+        output[i] = array[winner]
+        j = tree_size + winner
+
+        tree[j] = -1
+
+        while j > 1:
+            j //= 2
+            tree[j] = play_match(array, tree[j * 2], tree[j * 2 + 1])
+
+    if out is None:
+        array[:] = output
+        return array
+    return output
+
+
+def play_match(array, a, b): # returns the index of the smaller value, ties go to the lower index like the tuple comparison above
+    if a < 0:
+        return b
+    if b < 0:
+        return a
+    va = array[a]
+    vb = array[b]
+    if vb < va or (vb == va and b < a):
+        return b
+    return a
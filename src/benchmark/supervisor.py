@@ -0,0 +1,214 @@
+import errno
+import multiprocessing
+import sys
+import time
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+STATUS_OK = "ok"
+STATUS_TIMEOUT = "timeout"
+STATUS_OOM = "oom"
+STATUS_ERROR = "error"
+
+POLL_INTERVAL = 0.05
+
+
+def _proc_kb(pid: int | str, field: str) -> int | None:
+    # Linux only: VmRSS / VmSize etc. from /proc/<pid>/status, in kB
+    try:
+        with open(f"/proc/{pid}/status") as f:
+            for line in f:
+                if line.startswith(field + ":"):
+                    return int(line.split()[1])
+    except (OSError, ValueError):
+        pass
+    return None
+
+
+def _peak_rss_kb() -> int | None:
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # macOS reports bytes, Linux reports kilobytes
+    return peak // 1024 if sys.platform == "darwin" else peak
+
+
+def _limit_address_space(memory_limit_mb: float) -> None:
+    # Backstop for allocations the parent can't see in time: cap this process'
+    # address space at what it uses now plus the limit, so a runaway run fails
+    # with MemoryError instead of taking the machine down.
+    if resource is None or not hasattr(resource, "RLIMIT_AS"):
+        return
+    current_kb = _proc_kb("self", "VmSize")
+    if current_kb is None:
+        return
+    limit = current_kb * 1024 + int(memory_limit_mb * 1024 * 1024)
+    try:
+        resource.setrlimit(resource.RLIMIT_AS, (limit, resource.getrlimit(resource.RLIMIT_AS)[1]))
+    except (ValueError, OSError):
+        pass
+
+
+def _child(conn, algo_key: str, dataset_key: str, packed: bool, memory_limit_mb: float | None) -> None:
+    # Runs in the supervised process. Each phase is reported as it starts, so
+    # if the run is killed the parent still knows how far it got.
+    phase = "starting"
+    started = time.perf_counter()
+    try:
+        from algorithms.buffers import allocate_like, is_packed, packed_bytes
+        from main import (
+            ALGORITHMS,
+            DATASETS,
+            get_algorithm_fn,
+            load_dataset,
+            memory_saved_bytes,
+            time_algorithm,
+        )
+
+        # The memory limit is growth over this point, after imports and before
+        # any work: the parent's RSS watchdog and the address-space backstop
+        # both measure from here.
+        phase = "loading"
+        if memory_limit_mb:
+            _limit_address_space(memory_limit_mb)
+        conn.send({"phase": phase, "baseline_rss_kb": _proc_kb("self", "VmRSS")})
+        algo_info = ALGORITHMS[algo_key]
+        numbers = load_dataset(DATASETS[dataset_key]["filename"], packed=packed)
+        if is_packed(numbers) and not algo_info.get("buffers"):
+            numbers = list(numbers)
+
+        phase = "sorting"
+        conn.send({"phase": phase, "n": len(numbers)})
+        if is_packed(numbers):
+            out = allocate_like(numbers)
+            sorted_numbers, time_ms = time_algorithm(get_algorithm_fn(algo_key), numbers, out)
+        else:
+            sorted_numbers, time_ms = time_algorithm(get_algorithm_fn(algo_key), numbers)
+
+        phase = "verifying"
+        conn.send({"phase": phase, "time_ms": time_ms})
+        is_sorted = all(
+            sorted_numbers[i] <= sorted_numbers[i + 1]
+            for i in range(len(sorted_numbers) - 1)
+        )
+
+        conn.send({
+            "phase": "done",
+            "status": STATUS_OK,
+            "n": len(numbers),
+            "time_ms": time_ms,
+            "is_sorted": is_sorted,
+            "packed": is_packed(numbers),
+            "packed_bytes": packed_bytes(numbers) if is_packed(numbers) else None,
+            "memory_saved_bytes": memory_saved_bytes(numbers),
+            "head": list(sorted_numbers[:10]),
+            "tail": list(sorted_numbers[-10:]),
+            "child_peak_rss_kb": _peak_rss_kb(),
+        })
+    except MemoryError:
+        conn.send({"phase": phase, "status": STATUS_OOM, "error": "MemoryError", "child_peak_rss_kb": _peak_rss_kb()})
+    except Exception as exc:
+        # Under the RLIMIT_AS backstop, mmap and buffer allocations fail with
+        # ENOMEM rather than MemoryError
+        oom = isinstance(exc, OSError) and exc.errno == errno.ENOMEM
+        conn.send({
+            "phase": phase,
+            "status": STATUS_OOM if oom else STATUS_ERROR,
+            "error": f"{type(exc).__name__}: {exc}",
+            "child_peak_rss_kb": _peak_rss_kb(),
+        })
+    finally:
+        conn.send({"elapsed_ms": (time.perf_counter() - started) * 1000.0})
+        conn.close()
+
+
+def run_supervised(
+    algo_key: str,
+    dataset_key: str,
+    packed: bool = False,
+    time_limit_s: float | None = None,
+    memory_limit_mb: float | None = None,
+) -> dict:
+    """Run one algorithm/dataset benchmark in a child process under limits.
+
+    The child is stopped once it exceeds `time_limit_s` of wall-clock time or
+    grows its resident memory by more than `memory_limit_mb` over the baseline
+    it reports before loading the dataset. Always
+    returns a result dict: "status" is ok / timeout / oom / error, and
+    "phase", "n", "elapsed_ms" and "peak_rss_kb" describe how far the run got.
+    """
+    ctx = multiprocessing.get_context()
+    parent_conn, child_conn = ctx.Pipe(duplex=False)
+    proc = ctx.Process(
+        target=_child,
+        args=(child_conn, algo_key, dataset_key, packed, memory_limit_mb),
+        daemon=True,
+    )
+
+    result: dict = {"status": None, "phase": "starting", "n": None, "time_ms": None}
+    started = time.perf_counter()
+    proc.start()
+    child_conn.close()
+
+    peak_rss_kb = None
+    stop_reason = None
+    try:
+        while True:
+            if parent_conn.poll(POLL_INTERVAL):
+                try:
+                    result.update(parent_conn.recv())
+                except EOFError:
+                    break
+                continue
+            if not proc.is_alive():
+                break
+
+            rss_kb = _proc_kb(proc.pid, "VmRSS")
+            if rss_kb is not None:
+                peak_rss_kb = max(peak_rss_kb or 0, rss_kb)
+                baseline_rss_kb = result.get("baseline_rss_kb")
+                grown_kb = rss_kb - baseline_rss_kb if baseline_rss_kb is not None else 0
+                if memory_limit_mb and grown_kb > memory_limit_mb * 1024:
+                    stop_reason = STATUS_OOM
+                    break
+
+            if time_limit_s and time.perf_counter() - started > time_limit_s:
+                stop_reason = STATUS_TIMEOUT
+                break
+    finally:
+        stopped_ms = (time.perf_counter() - started) * 1000.0
+        # SIGKILL rather than SIGTERM: the child holds nothing worth cleaning
+        # up, and a forked pygame process has SDL's SIGTERM handler installed.
+        if proc.is_alive():
+            proc.kill()
+        proc.join()
+        parent_conn.close()
+
+    if stop_reason is not None:
+        result["status"] = stop_reason
+        result["elapsed_ms"] = stopped_ms
+    elif result["status"] is None:
+        # Died without reporting, e.g. killed by the kernel OOM killer
+        result["status"] = STATUS_ERROR
+        result["error"] = f"worker exited with code {proc.exitcode}"
+        result.setdefault("elapsed_ms", stopped_ms)
+
+    result["peak_rss_kb"] = max(filter(None, [peak_rss_kb, result.get("child_peak_rss_kb")]), default=None)
+    result["time_limit_s"] = time_limit_s
+    result["memory_limit_mb"] = memory_limit_mb
+    return result
+
+
+def describe_failure(result: dict) -> str:
+    elapsed = result.get("elapsed_ms") or 0.0
+    where = f"while {result['phase']}" if result.get("phase") not in (None, "done") else ""
+    if result["status"] == STATUS_TIMEOUT:
+        return f"Timed out after {elapsed / 1000:.1f} s {where}".strip()
+    if result["status"] == STATUS_OOM:
+        peak = result.get("peak_rss_kb")
+        peak_str = f", peak RSS {peak / 1024:.0f} MB" if peak else ""
+        return f"Out of memory {where}{peak_str}".strip()
+    return f"Failed {where}: {result.get('error', 'unknown error')}"
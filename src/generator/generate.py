@@ -1,28 +1,222 @@
+import argparse
+import os
 import random
+import sys
+import time
+from array import array
+from collections import Counter, deque
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
 DATASETS_DIR = Path(__file__).resolve().parent.parent / "datasets"
 
+# Values are generated in fixed-size blocks, each with its own seed derived from
+# (seed, block index). Workers only decide which process builds a block, so the
+# output is identical for any worker count.
+BLOCK_VALUES = 1 << 18
 
-def generate_random_large_range(
+# Below this many blocks, starting worker processes costs more than it saves.
+MIN_PARALLEL_BLOCKS = 4
+
+
+def _is_binary(path: Path) -> bool:
+    # .bin datasets are packed little-endian int64, everything else is one value per line
+    return path.suffix == ".bin"
+
+
+def _encode(values, binary: bool) -> bytes:
+    if binary:
+        packed = array("q", values)
+        if sys.byteorder == "big":
+            packed.byteswap()
+        return packed.tobytes()
+    if not values:
+        return b""
+    return ("\n".join(map(str, values)) + "\n").encode()
+
+
+def _python_block(seed: int, block: int, count: int, min_val: int, max_val: int) -> list[int]:
+    rng = random.Random(f"{seed}:{block}")
+    span = max_val - min_val + 1
+    if span > 1 << 64:
+        return [rng.randrange(min_val, max_val + 1) for _ in range(count)]
+
+    # One getrandbits call per block, split into 64-bit words and scaled into
+    # the range with a multiply-shift (bias is at most span / 2**64).
+    words = array("Q")
+    words.frombytes(rng.getrandbits(64 * count).to_bytes(8 * count, "little"))
+    if sys.byteorder == "big":
+        words.byteswap()
+    return [min_val + ((w * span) >> 64) for w in words]
+
+
+def _generate_block(task: tuple) -> bytes:
+    seed, block, count, min_val, max_val, backend, binary = task
+
+    if backend == "numpy":
+        rng = np.random.default_rng(np.random.SeedSequence(seed, spawn_key=(block,)))
+        values = rng.integers(min_val, max_val, size=count, endpoint=True, dtype=np.int64)
+        if binary:
+            return values.astype("<i8").tobytes()
+        return _encode(values.tolist(), binary=False)
+
+    return _encode(_python_block(seed, block, count, min_val, max_val), binary)
+
+
+def generate_random_dataset(
     n: int = 100_000,
     min_val: int = 1,
     max_val: int = 1000,
     filename: str = "random.txt",
     seed: int | None = None,
-) -> Path:
+    workers: int | None = None,
+    backend: str | None = None,
+) -> dict:
+    """Write `n` random values in [min_val, max_val] to `filename` in the datasets folder.
+
+    Output depends only on `seed` and `backend` ("numpy" when installed,
+    otherwise "python"), never on `workers`. Returns generation stats,
+    including the seed that was used and the values/second achieved.
+    """
     DATASETS_DIR.mkdir(parents=True, exist_ok=True)
-
     path = DATASETS_DIR / filename
+    binary = _is_binary(path)
+
+    if seed is None:
+        seed = random.SystemRandom().getrandbits(63)
+    if backend is None:
+        backend = "numpy" if np is not None and max_val < 2 ** 63 and min_val >= -2 ** 63 else "python"
+    if backend == "numpy" and np is None:
+        raise ValueError("numpy backend requested but numpy is not installed")
+
+    tasks = [
+        (seed, block, min(BLOCK_VALUES, n - start), min_val, max_val, backend, binary)
+        for block, start in enumerate(range(0, n, BLOCK_VALUES))
+    ]
+    if workers is None:
+        workers = min(os.cpu_count() or 1, len(tasks)) if len(tasks) >= MIN_PARALLEL_BLOCKS else 1
+    workers = max(1, workers)
+
+    start_time = time.perf_counter()
+    with path.open("wb") as f:
+        if workers == 1:
+            for task in tasks:
+                f.write(_generate_block(task))
+        else:
+            # Keep a bounded window of blocks in flight and write them in order,
+            # so memory stays flat however large n is.
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                pending = deque()
+                for task in tasks:
+                    pending.append(pool.submit(_generate_block, task))
+                    if len(pending) >= 2 * workers:
+                        f.write(pending.popleft().result())
+                while pending:
+                    f.write(pending.popleft().result())
+    seconds = time.perf_counter() - start_time
+
+    return {
+        "path": path,
+        "n": n,
+        "seed": seed,
+        "backend": backend,
+        "workers": workers,
+        "seconds": seconds,
+        "values_per_s": n / seconds if seconds > 0 else float("inf"),
+    }
 
-    rng = random.Random(seed) if seed is not None else random
 
-    with path.open("w") as f:
-        for _ in range(n):
-            value = rng.randint(min_val, max_val)
-            f.write(f"{value}\n")
+def generate_random_large_range(
+    n: int = 100_000,
+    min_val: int = 1,
+    max_val: int = 1000,
+    filename: str = "random.txt",
+    seed: int | None = None,
+    workers: int | None = None,
+) -> Path:
+    return generate_random_dataset(n, min_val, max_val, filename, seed, workers)["path"]
+
+
+def format_generation_stats(stats: dict) -> str:
+    return (
+        f"{stats['n']:,} values in {stats['seconds'] * 1000:.0f} ms "
+        f"({stats['values_per_s'] / 1e6:.2f}M values/s, {stats['backend']}, "
+        f"{stats['workers']} worker{'s' if stats['workers'] != 1 else ''}, seed {stats['seed']})"
+    )
+
+
+def read_values(path: Path) -> list[int]:
+    if _is_binary(path):
+        values = array("q")
+        with path.open("rb") as f:
+            values.frombytes(f.read())
+        if sys.byteorder == "big":
+            values.byteswap()
+        return values.tolist()
+    with path.open("r") as f:
+        return list(map(int, f.read().split()))
+
+
+def read_array(path: Path) -> array:
+    """Read a dataset straight into array('q'), never as a list of Python ints."""
+    if _is_binary(path):
+        values = array("q", [0]) * (path.stat().st_size // 8)
+        with path.open("rb") as f:
+            f.readinto(values)
+        if sys.byteorder == "big":
+            values.byteswap()
+        return values
+
+    values = array("q")
+    tail = ""
+    with path.open("r") as f:
+        # Fixed-size chunks; a number cut off at the end of one chunk is
+        # carried over to the next
+        while chunk := f.read(1 << 20):
+            chunk = tail + chunk
+            cut = chunk.rfind("\n") + 1
+            values.extend(map(int, chunk[:cut].split()))
+            tail = chunk[cut:]
+    values.extend(map(int, tail.split()))
+    return values
+
+
+def _read_for_transform(path: Path):
+    # Values outside int64 (possible with the python backend) fall back to a list
+    try:
+        return read_array(path)
+    except OverflowError:
+        return read_values(path)
+
+
+def _sort_in_place(values) -> None:
+    if isinstance(values, list):
+        values.sort()
+    elif np is not None:
+        np.frombuffer(values, dtype=np.int64).sort()
+    elif values and max(values) - min(values) <= len(values):
+        # Counting sort: the usual case, where the value range is no wider than n
+        counts = Counter(values)
+        pos = 0
+        for v in sorted(counts):
+            c = counts[v]
+            values[pos:pos + c] = array("q", [v]) * c
+            pos += c
+    else:
+        values[:] = array("q", sorted(values))
+
+
+def write_values(path: Path, values) -> None:
+    binary = _is_binary(path)
+    with path.open("wb") as f:
+        for start in range(0, len(values), BLOCK_VALUES):
+            f.write(_encode(values[start:start + BLOCK_VALUES], binary))
 
-    return path
 
 def sort_dataset_file(
     input_filename: str = "random.txt",
@@ -33,14 +227,11 @@ def sort_dataset_file(
     input_path = DATASETS_DIR / input_filename
     output_path = DATASETS_DIR / output_filename
 
-    with input_path.open("r") as f:
-        nums = [int(line.strip()) for line in f if line.strip()]
+    nums = _read_for_transform(input_path)
 
-    nums.sort()
+    _sort_in_place(nums)
 
-    with output_path.open("w") as f:
-        for value in nums:
-            f.write(f"{value}\n")
+    write_values(output_path, nums)
 
     return output_path
 
@@ -53,14 +244,12 @@ def generate_reverse_sorted_dataset(
     input_path = DATASETS_DIR / input_filename
     output_path = DATASETS_DIR / output_filename
 
-    with input_path.open("r") as f:
-        nums = [int(line.strip()) for line in f if line.strip()]
+    nums = _read_for_transform(input_path)
 
-    nums.sort(reverse=True)
+    _sort_in_place(nums)
+    nums.reverse()
 
-    with output_path.open("w") as f:
-        for value in nums:
-            f.write(f"{value}\n")
+    write_values(output_path, nums)
 
     return output_path
 
@@ -76,37 +265,51 @@ def generate_almost_sorted_dataset(
     input_path = DATASETS_DIR / input_filename
     output_path = DATASETS_DIR / output_filename
 
-    with input_path.open("r") as f:
-        nums = [int(line.strip()) for line in f if line.strip()]
+    nums = _read_for_transform(input_path)
 
-    nums.sort()
+    _sort_in_place(nums)
 
     n = len(nums)
     swaps = int(n * noise_fraction)
+    if seed is None:
+        seed = random.SystemRandom().getrandbits(63)
 
-    rng = random.Random(seed) if seed is not None else random
-
-    for _ in range(swaps):
-        i = rng.randrange(n)
-        j = rng.randrange(n)
-        nums[i], nums[j] = nums[j], nums[i]
+    # Swap positions are drawn in bulk, a block at a time. Negative block ids
+    # never collide with the blocks of the random dataset itself.
+    picks_total = 2 * swaps if n else 0
+    for chunk, start in enumerate(range(0, picks_total, BLOCK_VALUES)):
+        picks = iter(_python_block(seed, -1 - chunk, min(BLOCK_VALUES, picks_total - start), 0, n - 1))
+        for i, j in zip(picks, picks):
+            nums[i], nums[j] = nums[j], nums[i]
 
-    with output_path.open("w") as f:
-        for value in nums:
-            f.write(f"{value}\n")
+    write_values(output_path, nums)
 
     return output_path
 
 
 if __name__ == "__main__":
-    random_path = generate_random_large_range()
-    print(f"Generated random dataset at: {random_path}")
-
-    sorted_path = sort_dataset_file()
+    parser = argparse.ArgumentParser(description="Generate the benchmark datasets")
+    parser.add_argument("--n", type=int, default=100_000)
+    parser.add_argument("--min", type=int, default=1, dest="min_val")
+    parser.add_argument("--max", type=int, default=1000, dest="max_val")
+    parser.add_argument("--seed", type=int, default=None)
+    parser.add_argument("--workers", type=int, default=None, help="processes to generate with (default: CPU count)")
+    parser.add_argument("--backend", choices=["numpy", "python"], default=None)
+    parser.add_argument("--binary", action="store_true", help="write packed int64 .bin files instead of text")
+    args = parser.parse_args()
+
+    ext = "bin" if args.binary else "txt"
+    stats = generate_random_dataset(
+        args.n, args.min_val, args.max_val, f"random.{ext}", args.seed, args.workers, args.backend
+    )
+    print(f"Generated random dataset at: {stats['path']}")
+    print(f"  {format_generation_stats(stats)}")
+
+    sorted_path = sort_dataset_file(f"random.{ext}", f"sorted.{ext}")
     print(f"Sorted dataset written to: {sorted_path}")
 
-    reversed_path = generate_reverse_sorted_dataset()
+    reversed_path = generate_reverse_sorted_dataset(f"random.{ext}", f"reversed.{ext}")
     print(f"Reversed dataset written to: {reversed_path}")
 
-    almost_sorted_path = generate_almost_sorted_dataset()
+    almost_sorted_path = generate_almost_sorted_dataset(f"random.{ext}", f"almost_sorted.{ext}", seed=args.seed)
     print(f"Almost-sorted dataset written to: {almost_sorted_path}")
@@ -1,25 +1,44 @@
 import time
+
+# Taken before any other import so startup timings include them.
+_STARTED = time.perf_counter()
+
+import argparse
+import mmap
 import os
 import sys
+from array import array
 from pathlib import Path
-from algorithms.merge_sort import merge_sort
-from algorithms.quick_sort import quick_sort
-from algorithms.tournament_sort import tourney_sort
-from generator.generate import (
-    generate_random_large_range,
-    sort_dataset_file,
-    generate_reverse_sorted_dataset,
-    generate_almost_sorted_dataset,
-)
-
-def load_dataset(filename: str) -> list[int]:
-    base_dir = Path(__file__).resolve().parent
-    datasets_dir = base_dir / "datasets"
-    path = datasets_dir / filename
+from algorithms.buffers import copy_values, is_packed, list_bytes, packed_bytes
+from algorithms.registry import available_algorithms, load_algorithm
+
+DATASETS_DIR = Path(__file__).resolve().parent / "datasets"
+
+
+def dataset_path(filename: str) -> Path:
+    # DATASETS names the text files. Packed runs generate .bin datasets
+    # instead, and when one exists it takes the place of the text file.
+    path = DATASETS_DIR / filename
+    binary_path = path.with_suffix(".bin")
+    return binary_path if binary_path.exists() else path
+
+
+def load_dataset(filename: str, packed: bool = False):
+    path = dataset_path(filename)
 
     if not path.exists():
         raise FileNotFoundError(f"Dataset file not found: {path}")
 
+    if path.suffix == ".bin":
+        numbers = map_dataset(path)
+        return numbers if packed else numbers.tolist()
+
+    if packed:
+        numbers = array("q")
+        with path.open("r") as f:
+            numbers.extend(int(line) for line in f if line.strip())
+        return numbers
+
     text = path.read_text().strip()
 
     tokens = text.splitlines()
@@ -32,40 +51,65 @@ def load_dataset(filename: str) -> list[int]:
 
     return numbers
 
-def regenerate_all_datasets(max_val: int = 1000) -> None:
+
+def map_dataset(path: Path) -> memoryview:
+    # Binary datasets are packed little-endian int64. ACCESS_COPY gives a
+    # private mapping, so sorting it in place never writes back to the file.
+    if path.stat().st_size == 0:
+        return memoryview(bytearray()).cast("q")
+    with path.open("rb") as f:
+        mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_COPY)
+    return memoryview(mapped).cast("q")
+
+
+# Parameters of the datasets currently on disk, recorded alongside every run.
+DATASET_PARAMS: dict = {"max_val": None, "seed": None}
+
+
+def regenerate_all_datasets(max_val: int = 1000, binary: bool = False) -> None:
+    from generator.generate import (
+        format_generation_stats,
+        generate_almost_sorted_dataset,
+        generate_random_dataset,
+        generate_reverse_sorted_dataset,
+        sort_dataset_file,
+    )
+
+    # Binary datasets are packed int64 files that --packed runs memory-map.
+    # Files in the other format are removed so only one generation is on disk.
+    ext, stale_ext = ("bin", "txt") if binary else ("txt", "bin")
+    for name in ("random", "sorted", "reversed", "almost_sorted"):
+        (DATASETS_DIR / f"{name}.{stale_ext}").unlink(missing_ok=True)
+
     print(f"\nGenerating datasets (random max = {max_val})...")
-    random_path = generate_random_large_range(max_val=max_val)
-    print(f"  Random: {random_path}")
+    stats = generate_random_dataset(max_val=max_val, filename=f"random.{ext}")
+    DATASET_PARAMS.update(max_val=max_val, seed=stats["seed"])
+    print(f"  Random: {stats['path']}")
+    print(f"    {format_generation_stats(stats)}")
 
-    sorted_path = sort_dataset_file()
+    sorted_path = sort_dataset_file(f"random.{ext}", f"sorted.{ext}")
     print(f"  Sorted: {sorted_path}")
 
-    reversed_path = generate_reverse_sorted_dataset()
+    reversed_path = generate_reverse_sorted_dataset(f"random.{ext}", f"reversed.{ext}")
     print(f"  Reverse sorted: {reversed_path}")
 
-    almost_sorted_path = generate_almost_sorted_dataset()
+    # Derived from the recorded seed, so that one seed reproduces all four datasets
+    almost_sorted_path = generate_almost_sorted_dataset(
+        f"random.{ext}", f"almost_sorted.{ext}", seed=stats["seed"]
+    )
     print(f"  Almost sorted: {almost_sorted_path}")
     print("Dataset generation complete.")
 
 
 
+# Menu keys map onto registry ids. Algorithm modules are only imported the
+# first time get_algorithm_fn() is called for them.
 ALGORITHMS: dict[str, dict] = {
-    "1": {
-        "name": "Tournament Sort",
-        "fn": tourney_sort,
-        "complexity": "O(n log n)",
-    },
-    "2": {
-        "name": "Merge Sort",
-        "fn": merge_sort,
-        "complexity": "O(n log n)",
-    },
-    "3": {
-        "name": "Quick Sort",
-        "fn": quick_sort,
-        "complexity": "O(n log n) average, O(n^2) worst",
-    },
+    str(i): {"id": algo_id, **info}
+    for i, (algo_id, info) in enumerate(available_algorithms().items(), start=1)
 }
+UI_OPTION = str(len(ALGORITHMS) + 1)
+QUIT_OPTION = str(len(ALGORITHMS) + 2)
 
 DATASETS: dict[str, dict] = {
     "1": {
@@ -90,8 +134,28 @@ DATASETS: dict[str, dict] = {
     },
 }
 
-def time_algorithm(algorithm_fn, data: list[int]) -> tuple[list[int], float]:
-    arr = data.copy()
+def get_algorithm_fn(algo_key: str):
+    return load_algorithm(ALGORITHMS[algo_key]["id"])
+
+
+def startup_time_ms(started: float = _STARTED) -> float:
+    # Entry scripts pass their own start time; the default is when this
+    # module started importing.
+    return (time.perf_counter() - started) * 1000.0
+
+
+def time_algorithm(algorithm_fn, data, out=None):
+    # Packed data (array.array / memoryview) is sorted as-is. Passing a
+    # preallocated `out` of the same type leaves `data` untouched, so it
+    # doesn't need copying first.
+    if out is not None:
+        arr = data
+        start = time.perf_counter()
+        result = algorithm_fn(arr, out)
+        end = time.perf_counter()
+        return result, (end - start) * 1000.0
+
+    arr = copy_values(data)
 
     start = time.perf_counter()
     result = algorithm_fn(arr)
@@ -103,21 +167,67 @@ def time_algorithm(algorithm_fn, data: list[int]) -> tuple[list[int], float]:
     time_ms = (end - start) * 1000.0
     return result, time_ms
 
+def memory_saved_bytes(data) -> int:
+    if not is_packed(data):
+        return 0
+    return list_bytes(data) - packed_bytes(data)
+
+
+def record_benchmark(
+    algo_key: str,
+    dataset_key: str,
+    n: int,
+    time_ms: float | None,
+    packed: bool = False,
+    status: str = "ok",
+    rss_kb: int | None = None,
+) -> None:
+    from results.store import record_run
+
+    dataset_info = DATASETS[dataset_key]
+    record_run(
+        algorithm=ALGORITHMS[algo_key]["id"],
+        dataset=dataset_info["name"],
+        n=n,
+        time_ms=time_ms,
+        # The seed changes every launch, so it goes in its own column; in
+        # params it would stop sessions from ever sharing a compare cell.
+        params={"filename": dataset_info["filename"], "packed": packed, "max_val": DATASET_PARAMS["max_val"]},
+        seed=DATASET_PARAMS["seed"],
+        # Runs happen in a supervised child, so this process' RSS says nothing
+        # about them; an unknown peak is stored as NULL.
+        peak_rss_kb=rss_kb,
+        status=status,
+    )
+
+
+def record_supervised(algo_key: str, dataset_key: str, result: dict) -> None:
+    record_benchmark(
+        algo_key,
+        dataset_key,
+        result["n"] or 0,
+        result["time_ms"] if result["status"] == "ok" else None,
+        packed=bool(result.get("packed")),
+        status=result["status"],
+        rss_kb=result["peak_rss_kb"],
+    )
+
+
 def print_options():
     print("")
     for key, info in ALGORITHMS.items():
         print(f"  {key}. {info['name']} ({info['complexity']})")
-    print("  4. Open UI (requires pygame - 'pip install pygame')")
-    print("  5. Quit\n")
+    print(f"  {UI_OPTION}. Open UI (requires pygame - 'pip install pygame')")
+    print(f"  {QUIT_OPTION}. Quit\n")
 
-def choose_algorithm() -> str:
+def choose_algorithm(ui_args: str = "") -> str:
     print_options()
     while True:
         choice = input("Select an option or algorithm by number: ").strip()
-        if choice == "4":
-            os.system('python visuals.py')
+        if choice == UI_OPTION:
+            os.system(f'python visuals.py {ui_args}'.strip())
             print_options()
-        elif choice == "5":
+        elif choice == QUIT_OPTION:
             sys.exit(0)
         elif choice in ALGORITHMS:
             return choice
@@ -137,12 +247,56 @@ def choose_dataset() -> str:
         print("Invalid choice, please try again.")
 
 
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Sorting Algorithm Comparison Tool")
+    parser.add_argument(
+        "--profile",
+        action="store_true",
+        help="after each timed run, profile a separate run and report hot functions",
+    )
+    parser.add_argument("--profile-top", type=int, default=10, help="number of hot functions to show")
+    parser.add_argument(
+        "--packed",
+        action="store_true",
+        help="load datasets as packed 64-bit arrays and sort them in place instead of as lists",
+    )
+    parser.add_argument(
+        "--time-limit",
+        type=float,
+        default=None,
+        metavar="SECONDS",
+        help="stop a run that takes longer than this (wall clock)",
+    )
+    parser.add_argument(
+        "--memory-limit",
+        type=float,
+        default=None,
+        metavar="MB",
+        help="stop a run that grows its memory by more than this",
+    )
+    return parser.parse_args(argv)
+
+
 def main():
+    imports_ms = startup_time_ms()
+    args = parse_args()
+    ui_args = f"--profile --profile-top {args.profile_top}" if args.profile else ""
+    if args.packed:
+        ui_args += " --packed"
+    if args.time_limit:
+        ui_args += f" --time-limit {args.time_limit}"
+    if args.memory_limit:
+        ui_args += f" --memory-limit {args.memory_limit}"
+
     print("=== Sorting Algorithm Comparison Tool ===")
-    regenerate_all_datasets(max_val=1000)
+    print(
+        f"Ready in {startup_time_ms():.1f} ms "
+        f"(imports {imports_ms:.1f} ms, {len(ALGORITHMS)} algorithms registered)"
+    )
+    regenerate_all_datasets(max_val=1000, binary=args.packed)
 
     while True:
-        algo_choice = choose_algorithm()
+        algo_choice = choose_algorithm(ui_args)
         dataset_choice = choose_dataset()
 
         algo_info = ALGORITHMS[algo_choice]
@@ -150,28 +304,55 @@ def main():
 
         print(f"\nYou selected algorithm: {algo_info['name']}")
         print(f"Complexity: {algo_info['complexity']}")
-        print(f"Dataset: {dataset_info['name']} ({dataset_info['filename']})")
+        print(f"Dataset: {dataset_info['name']} ({dataset_path(dataset_info['filename']).name})")
 
-        print("\nLoading dataset...")
-        numbers = load_dataset(dataset_info["filename"])
-        print(f"Loaded {len(numbers)} numbers.")
+        if args.packed and not algo_info.get("buffers"):
+            print(f"{algo_info['name']} does not accept packed input, a list will be used.")
 
+        # The run happens in a supervised child process, so a pathological
+        # case can be stopped without taking the CLI down with it.
         print("\nRunning algorithm, please wait...")
-        sorted_numbers, time_ms = time_algorithm(algo_info["fn"], numbers)
-
-        is_sorted = all(
-            sorted_numbers[i] <= sorted_numbers[i + 1]
-            for i in range(len(sorted_numbers) - 1)
+        from benchmark.supervisor import describe_failure, run_supervised
+
+        result = run_supervised(
+            algo_choice,
+            dataset_choice,
+            packed=args.packed,
+            time_limit_s=args.time_limit,
+            memory_limit_mb=args.memory_limit,
         )
+        record_supervised(algo_choice, dataset_choice, result)
 
         print("\n=== Results ===")
         print(f"Algorithm: {algo_info['name']}")
         print(f"Dataset: {dataset_info['name']}")
-        print(f"n: {len(numbers)}")
-        print(f"Time: {time_ms:.3f} ms")
-        print(f"Sorted OK: {is_sorted}")
-        print(f"First 10 elements: {sorted_numbers[:10]}")
-        print(f"Last 10 elements: {sorted_numbers[-10:]}")
+        print(f"n: {result['n'] if result['n'] is not None else 'not loaded'}")
+
+        if result["status"] != "ok":
+            print(f"Status: {result['status'].upper()} - {describe_failure(result)}")
+            if result.get("peak_rss_kb"):
+                print(f"Peak memory: {result['peak_rss_kb'] / 1024:.1f} MB")
+            print("(Recorded in the results store.)")
+            print("\nYou can choose another algorithm/dataset, open the UI, or Quit.")
+            continue
+
+        print(f"Time: {result['time_ms']:.3f} ms")
+        print(f"Sorted OK: {result['is_sorted']}")
+        if result["packed"]:
+            saved = result["memory_saved_bytes"]
+            print(f"Memory: {result['packed_bytes'] / 1e6:.1f} MB packed ({saved / 1e6:.1f} MB saved vs a list)")
+        print(f"First 10 elements: {result['head']}")
+        print(f"Last 10 elements: {result['tail']}")
+        if args.profile:
+            from profiling.hotpath import print_hot_functions, profile_run
+
+            print("\nProfiling a separate run (not included in the time above)...")
+            numbers = load_dataset(dataset_info["filename"], packed=args.packed and algo_info.get("buffers", False))
+            label = f"{algo_info['id']}_{dataset_info['filename'].rsplit('.', 1)[0]}"
+            report = profile_run(get_algorithm_fn(algo_choice), numbers, label, top_n=args.profile_top)
+            print_hot_functions(report)
+
+        print("(Saved to the results store - run 'python results/store.py compare' to check for regressions.)")
         print("\nYou can choose another algorithm/dataset, open the UI, or Quit.")
 
 if __name__ == "__main__":
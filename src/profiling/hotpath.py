@@ -0,0 +1,149 @@
+import cProfile
+import pstats
+import sys
+import threading
+import time
+from collections import Counter
+from datetime import datetime
+from pathlib import Path
+
+from algorithms.buffers import copy_values
+
+PROFILES_DIR = Path(__file__).resolve().parent.parent / "profiles"
+
+# The sampler reads other threads' frames through sys._current_frames(),
+# which is a CPython detail; elsewhere only the cProfile pass runs.
+SAMPLING_AVAILABLE = hasattr(sys, "_current_frames")
+
+
+def _frame_label(frame) -> str:
+    code = frame.f_code
+    return f"{code.co_name} ({Path(code.co_filename).name}:{frame.f_lineno})"
+
+
+class StackSampler:
+    """Samples one thread's Python stack at a fixed interval from a helper thread."""
+
+    def __init__(self, thread_id: int, root_code, interval: float = 0.001):
+        self.thread_id = thread_id
+        self.interval = interval
+        # Only stacks running under this code object are kept, starting from it.
+        self.root_code = root_code
+        self.stacks: Counter = Counter()
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+
+    def _run(self):
+        while not self._stop.is_set():
+            frame = sys._current_frames().get(self.thread_id)
+            stack = []
+            while frame is not None:
+                stack.append(_frame_label(frame))
+                if frame.f_code is self.root_code:
+                    self.stacks[";".join(reversed(stack))] += 1
+                    break
+                frame = frame.f_back
+            time.sleep(self.interval)
+
+    def __enter__(self):
+        # The sampled thread only yields the GIL every switch interval (5 ms by
+        # default), so shorten it to get close to the requested sample rate.
+        self._switch_interval = sys.getswitchinterval()
+        sys.setswitchinterval(min(self._switch_interval, self.interval))
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self._stop.set()
+        self._thread.join()
+        sys.setswitchinterval(self._switch_interval)
+
+
+def _run_target(algorithm_fn, arr):
+    return algorithm_fn(arr)
+
+
+def _pstats_to_collapsed(stats: pstats.Stats) -> Counter:
+    # cProfile only keeps caller -> callee edges, so without the sampler the
+    # flamegraph is two levels deep, weighted by microseconds of own time.
+    collapsed: Counter = Counter()
+    for func, (_, _, _, _, callers) in stats.stats.items():
+        name = pstats.func_std_string(func)
+        for caller, edge in callers.items():
+            tottime = edge[2] if isinstance(edge, tuple) else 0.0
+            weight = int(tottime * 1_000_000)
+            if weight:
+                collapsed[f"{pstats.func_std_string(caller)};{name}"] += weight
+    return collapsed
+
+
+def _write_collapsed(path: Path, stacks: Counter) -> None:
+    with path.open("w") as f:
+        f.write("".join(f"{stack} {count}\n" for stack, count in stacks.most_common()))
+
+
+def profile_run(
+    algorithm_fn,
+    data,
+    label: str,
+    out_dir: Path = PROFILES_DIR,
+    top_n: int = 10,
+    sample_interval: float = 0.001,
+) -> dict:
+    """Profile `algorithm_fn` on a copy of `data` and write the reports to `out_dir`.
+
+    Runs separately from the timed benchmark, so profiling overhead never ends
+    up in the reported timings. Writes `<label>_<timestamp>.pstats` and `.collapsed.txt`
+    (flamegraph.pl / speedscope format) and returns the paths plus the top
+    `top_n` functions by own time.
+    """
+    out_dir.mkdir(parents=True, exist_ok=True)
+    stem = f"{label}_{datetime.now():%Y%m%d-%H%M%S}"
+    pstats_path = out_dir / f"{stem}.pstats"
+    collapsed_path = out_dir / f"{stem}.collapsed.txt"
+
+    arr = copy_values(data)
+    profiler = cProfile.Profile()
+    profiler.enable()
+    _run_target(algorithm_fn, arr)
+    profiler.disable()
+    profiler.dump_stats(pstats_path)
+    stats = pstats.Stats(profiler)
+
+    if SAMPLING_AVAILABLE:
+        arr = copy_values(data)
+        with StackSampler(threading.get_ident(), _run_target.__code__, sample_interval) as sampler:
+            _run_target(algorithm_fn, arr)
+        stacks = sampler.stacks
+        sampler_name = "sampling"
+    else:
+        stacks = _pstats_to_collapsed(stats)
+        sampler_name = "cprofile-edges"
+    _write_collapsed(collapsed_path, stacks)
+
+    top = sorted(stats.stats.items(), key=lambda item: item[1][2], reverse=True)[:top_n]
+    return {
+        "pstats": pstats_path,
+        "collapsed": collapsed_path,
+        "collapsed_source": sampler_name,
+        "samples": sum(stacks.values()) if SAMPLING_AVAILABLE else None,
+        "total_time": stats.total_tt,
+        "top": [
+            {
+                "function": pstats.func_std_string(func),
+                "ncalls": nc,
+                "tottime": tt,
+                "cumtime": ct,
+            }
+            for func, (_, nc, tt, ct, _) in top
+        ],
+    }
+
+
+def print_hot_functions(report: dict) -> None:
+    print(f"\nTop {len(report['top'])} functions by own time (cProfile, {report['total_time'] * 1000:.1f} ms profiled):")
+    print(f"  {'ncalls':>10} {'tottime':>9} {'cumtime':>9}  function")
+    for row in report["top"]:
+        print(f"  {row['ncalls']:>10} {row['tottime']:>9.4f} {row['cumtime']:>9.4f}  {row['function']}")
+    print(f"Profile: {report['pstats']}")
+    print(f"Collapsed stacks ({report['collapsed_source']}): {report['collapsed']}")
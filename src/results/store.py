@@ -0,0 +1,374 @@
+import argparse
+import json
+import math
+import os
+import platform
+import sqlite3
+import subprocess
+import sys
+from datetime import datetime
+from pathlib import Path
+from statistics import fmean, variance
+
+RESULTS_DB = Path(__file__).resolve().parent.parent / "results.db"
+
+# Every process that records runs gets its own session id, so "the latest run"
+# means all timings recorded by the most recent CLI/UI session.
+SESSION_ID = f"{datetime.now():%Y%m%dT%H%M%S}-{os.getpid()}"
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    session TEXT NOT NULL,
+    created_at TEXT NOT NULL,
+    algorithm TEXT NOT NULL,
+    dataset TEXT NOT NULL,
+    params TEXT NOT NULL,
+    n INTEGER NOT NULL,
+    seed INTEGER,
+    time_ms REAL,
+    peak_rss_kb INTEGER,
+    machine TEXT NOT NULL,
+    git_commit TEXT,
+    status TEXT NOT NULL DEFAULT 'ok'
+);
+CREATE INDEX IF NOT EXISTS runs_session ON runs (session);
+CREATE INDEX IF NOT EXISTS runs_algorithm ON runs (algorithm, dataset);
+CREATE TABLE IF NOT EXISTS baselines (
+    name TEXT PRIMARY KEY,
+    session TEXT NOT NULL
+);
+"""
+
+_machine_info: dict | None = None
+_git_commit: str | None = None
+
+
+def connect(db_path: Path = RESULTS_DB) -> sqlite3.Connection:
+    conn = sqlite3.connect(db_path)
+    conn.executescript(SCHEMA)
+    return conn
+
+
+def machine_info() -> dict:
+    global _machine_info
+    if _machine_info is None:
+        _machine_info = {
+            "node": platform.node(),
+            "platform": platform.platform(),
+            "processor": platform.processor() or platform.machine(),
+            "cpu_count": os.cpu_count(),
+            "python": platform.python_version(),
+            "implementation": platform.python_implementation(),
+        }
+    return _machine_info
+
+
+def git_commit() -> str | None:
+    global _git_commit
+    if _git_commit is None:
+        try:
+            out = subprocess.run(
+                ["git", "rev-parse", "HEAD"],
+                cwd=Path(__file__).resolve().parent,
+                capture_output=True,
+                text=True,
+                timeout=5,
+            )
+        except (OSError, subprocess.SubprocessError):
+            out = None
+        _git_commit = out.stdout.strip() if out and out.returncode == 0 else ""
+    return _git_commit or None
+
+
+def record_run(
+    algorithm: str,
+    dataset: str,
+    n: int,
+    time_ms: float | None,
+    params: dict | None = None,
+    seed: int | None = None,
+    peak_rss_kb: int | None = None,
+    status: str = "ok",
+    db_path: Path = RESULTS_DB,
+) -> int:
+    with connect(db_path) as conn:
+        cur = conn.execute(
+            "INSERT INTO runs (session, created_at, algorithm, dataset, params, n, seed,"
+            " time_ms, peak_rss_kb, machine, git_commit, status)"
+            " VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            (
+                SESSION_ID,
+                datetime.now().isoformat(timespec="seconds"),
+                algorithm,
+                dataset,
+                json.dumps(params or {}, sort_keys=True),
+                n,
+                seed,
+                time_ms,
+                peak_rss_kb,
+                json.dumps(machine_info(), sort_keys=True),
+                git_commit(),
+                status,
+            ),
+        )
+    conn.close()
+    return cur.lastrowid
+
+
+def list_sessions(conn: sqlite3.Connection, limit: int = 20) -> list[tuple]:
+    return conn.execute(
+        "SELECT session, MIN(created_at), COUNT(*), MAX(git_commit) FROM runs"
+        " GROUP BY session ORDER BY MAX(id) DESC LIMIT ?",
+        (limit,),
+    ).fetchall()
+
+
+def resolve_session(conn: sqlite3.Connection, ref: str | None, offset: int = 0) -> str | None:
+    # ref may be a named baseline, a session id, or None for the Nth most recent session.
+    if ref is not None:
+        row = conn.execute("SELECT session FROM baselines WHERE name = ?", (ref,)).fetchone()
+        if row:
+            return row[0]
+        row = conn.execute("SELECT session FROM runs WHERE session = ? LIMIT 1", (ref,)).fetchone()
+        return row[0] if row else None
+
+    sessions = list_sessions(conn, limit=offset + 1)
+    return sessions[offset][0] if len(sessions) > offset else None
+
+
+def mark_baseline(session: str, name: str = "default", db_path: Path = RESULTS_DB) -> None:
+    with connect(db_path) as conn:
+        conn.execute(
+            "INSERT OR REPLACE INTO baselines (name, session) VALUES (?, ?)",
+            (name, session),
+        )
+    conn.close()
+
+
+def _session_timings(conn: sqlite3.Connection, session: str) -> dict[tuple, list[float]]:
+    timings: dict[tuple, list[float]] = {}
+    rows = conn.execute(
+        "SELECT algorithm, dataset, n, params, time_ms FROM runs"
+        " WHERE session = ? AND status = 'ok' AND time_ms IS NOT NULL",
+        (session,),
+    )
+    for algorithm, dataset, n, params, time_ms in rows:
+        # Older rows carried the per-launch seed in params; it isn't part of
+        # what makes two runs comparable.
+        key_params = json.loads(params)
+        key_params.pop("seed", None)
+        key = (algorithm, dataset, n, json.dumps(key_params, sort_keys=True))
+        timings.setdefault(key, []).append(time_ms)
+    return timings
+
+
+def _betacf(a: float, b: float, x: float) -> float:
+    # Continued fraction for the regularized incomplete beta function (Lentz's method).
+    tiny = 1e-300
+    qab, qap, qam = a + b, a + 1.0, a - 1.0
+    c, d = 1.0, 1.0 - qab * x / qap
+    d = 1.0 / (d if abs(d) > tiny else tiny)
+    h = d
+    for m in range(1, 201):
+        m2 = 2 * m
+        aa = m * (b - m) * x / ((qam + m2) * (a + m2))
+        d = 1.0 + aa * d
+        d = 1.0 / (d if abs(d) > tiny else tiny)
+        c = 1.0 + aa / c
+        c = c if abs(c) > tiny else tiny
+        h *= d * c
+        aa = -(a + m) * (qab + m) * x / ((a + m2) * (qap + m2))
+        d = 1.0 + aa * d
+        d = 1.0 / (d if abs(d) > tiny else tiny)
+        c = 1.0 + aa / c
+        c = c if abs(c) > tiny else tiny
+        delta = d * c
+        h *= delta
+        if abs(delta - 1.0) < 1e-12:
+            break
+    return h
+
+
+def _betainc(a: float, b: float, x: float) -> float:
+    if x <= 0.0:
+        return 0.0
+    if x >= 1.0:
+        return 1.0
+    front = math.exp(
+        math.lgamma(a + b) - math.lgamma(a) - math.lgamma(b) + a * math.log(x) + b * math.log1p(-x)
+    )
+    if x < (a + 1.0) / (a + b + 2.0):
+        return front * _betacf(a, b, x) / a
+    return 1.0 - front * _betacf(b, a, 1.0 - x) / b
+
+
+def welch_t_test(baseline: list[float], latest: list[float]) -> tuple[float, float]:
+    """One-sided Welch's t-test that `latest` is slower than `baseline`.
+
+    Returns the t statistic and the p-value.
+    """
+    m1, m2 = fmean(baseline), fmean(latest)
+    se1 = variance(baseline) / len(baseline)
+    se2 = variance(latest) / len(latest)
+    se = se1 + se2
+    if se == 0.0:
+        return (math.inf if m2 > m1 else 0.0), (0.0 if m2 > m1 else 1.0)
+
+    t = (m2 - m1) / math.sqrt(se)
+    df = se ** 2 / (se1 ** 2 / (len(baseline) - 1) + se2 ** 2 / (len(latest) - 1))
+    two_sided = _betainc(df / 2.0, 0.5, df / (df + t * t))
+    p = two_sided / 2.0 if t > 0 else 1.0 - two_sided / 2.0
+    return t, p
+
+
+def compare_sessions(
+    conn: sqlite3.Connection,
+    baseline: str,
+    latest: str,
+    alpha: float = 0.05,
+    threshold: float = 0.05,
+) -> list[dict]:
+    """Compare every (algorithm, dataset, n) cell present in both sessions.
+
+    A cell is a regression when the latest mean is more than `threshold`
+    slower than the baseline and the slowdown is significant at `alpha`.
+    """
+    base = _session_timings(conn, baseline)
+    new = _session_timings(conn, latest)
+
+    report: list[dict] = []
+    for key in sorted(base.keys() & new.keys()):
+        algorithm, dataset, n, _ = key
+        b, l = base[key], new[key]
+        change = (fmean(l) - fmean(b)) / fmean(b) if fmean(b) > 0 else 0.0
+
+        if len(b) < 2 or len(l) < 2:
+            p = None
+            status = "insufficient samples"
+        else:
+            _, p = welch_t_test(b, l)
+            if p < alpha and change > threshold:
+                status = "REGRESSION"
+            elif change < -threshold and 1.0 - p < alpha:
+                status = "improved"
+            else:
+                status = "ok"
+
+        report.append({
+            "algorithm": algorithm,
+            "dataset": dataset,
+            "n": n,
+            "baseline_ms": fmean(b),
+            "latest_ms": fmean(l),
+            "baseline_samples": len(b),
+            "latest_samples": len(l),
+            "change": change,
+            "p_value": p,
+            "status": status,
+        })
+    return report
+
+
+def history_for_algorithm(
+    algorithm: str,
+    limit_sessions: int = 5,
+    exclude_session: str | None = SESSION_ID,
+    db_path: Path = RESULTS_DB,
+) -> list[tuple[str, dict[str, float]]]:
+    """Mean time per dataset for the most recent sessions that ran `algorithm`."""
+    if not db_path.exists():
+        return []
+
+    conn = connect(db_path)
+    rows = conn.execute(
+        "SELECT session, dataset, AVG(time_ms) FROM runs"
+        " WHERE algorithm = ? AND status = 'ok' AND session != ?"
+        " AND session IN ("
+        "   SELECT session FROM runs WHERE algorithm = ? AND session != ?"
+        "   GROUP BY session ORDER BY MAX(id) DESC LIMIT ?"
+        " )"
+        " GROUP BY session, dataset ORDER BY MAX(id)",
+        (algorithm, exclude_session or "", algorithm, exclude_session or "", limit_sessions),
+    ).fetchall()
+    conn.close()
+
+    history: dict[str, dict[str, float]] = {}
+    for session, dataset, mean_ms in rows:
+        history.setdefault(session, {})[dataset] = mean_ms
+    return list(history.items())
+
+
+def print_report(report: list[dict], baseline: str, latest: str) -> None:
+    print(f"Baseline session: {baseline}")
+    print(f"Latest session:   {latest}\n")
+    if not report:
+        print("No algorithm/dataset cells in common.")
+        return
+
+    header = f"{'Algorithm':<18} {'Dataset':<15} {'n':>9} {'Base ms':>10} {'Latest ms':>10} {'Change':>8} {'p':>7}  Status"
+    print(header)
+    print("-" * len(header))
+    for row in report:
+        p = f"{row['p_value']:.3f}" if row["p_value"] is not None else "-"
+        print(
+            f"{row['algorithm']:<18} {row['dataset']:<15} {row['n']:>9} "
+            f"{row['baseline_ms']:>10.2f} {row['latest_ms']:>10.2f} "
+            f"{row['change']:>+7.1%} {p:>7}  {row['status']}"
+        )
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Benchmark results store")
+    parser.add_argument("--db", type=Path, default=RESULTS_DB)
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    sub.add_parser("list", help="list recorded sessions")
+
+    compare = sub.add_parser("compare", help="compare the latest session to a baseline")
+    compare.add_argument("--baseline", help="baseline name or session id (default: named 'default', else previous session)")
+    compare.add_argument("--latest", help="session id to check (default: most recent)")
+    compare.add_argument("--alpha", type=float, default=0.05)
+    compare.add_argument("--threshold", type=float, default=0.05, help="minimum relative slowdown to flag")
+
+    mark = sub.add_parser("mark-baseline", help="name a session as a baseline")
+    mark.add_argument("session", nargs="?", help="session id (default: most recent)")
+    mark.add_argument("--name", default="default")
+
+    args = parser.parse_args(argv)
+    conn = connect(args.db)
+
+    if args.command == "list":
+        for session, started, count, commit in list_sessions(conn):
+            print(f"{session}  {started}  {count:>4} runs  {(commit or '-')[:10]}")
+        return 0
+
+    if args.command == "mark-baseline":
+        session = resolve_session(conn, args.session)
+        if session is None:
+            print("No such session.")
+            return 2
+        mark_baseline(session, args.name, db_path=args.db)
+        print(f"Marked {session} as baseline '{args.name}'.")
+        return 0
+
+    latest = resolve_session(conn, args.latest)
+    if args.baseline is not None:
+        baseline = resolve_session(conn, args.baseline)
+    else:
+        baseline = resolve_session(conn, "default") or resolve_session(conn, None, offset=1)
+    if latest is None or baseline is None or latest == baseline:
+        print("Need two different sessions to compare.")
+        return 2
+
+    report = compare_sessions(conn, baseline, latest, alpha=args.alpha, threshold=args.threshold)
+    print_report(report, baseline, latest)
+    regressions = [row for row in report if row["status"] == "REGRESSION"]
+    if regressions:
+        print(f"\n{len(regressions)} significant regression(s) found.")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
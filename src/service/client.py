@@ -0,0 +1,108 @@
+import asyncio
+import itertools
+import json
+from array import array
+
+from service.protocol import (
+    DEFAULT_HOST,
+    DEFAULT_PORT,
+    OP_SORT,
+    OP_STATS,
+    OP_TOP_K,
+    RESPONSE_HEADER,
+    STATUS_ERROR,
+    STATUS_OK,
+    VALUE_SIZE,
+    encode_request,
+    unpack_values,
+)
+
+
+class SortServiceError(Exception):
+    pass
+
+
+class SortClient:
+    """Async client for the local sort server.
+
+    Requests can be pipelined: several sort() calls may be awaited
+    concurrently over one connection and are matched up by job id.
+    """
+
+    def __init__(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        self.reader = reader
+        self.writer = writer
+        self._job_ids = itertools.count(1)
+        self._pending: dict[int, asyncio.Future] = {}
+        self._reader_task = asyncio.create_task(self._read_responses())
+
+    @classmethod
+    async def connect(
+        cls,
+        host: str = DEFAULT_HOST,
+        port: int = DEFAULT_PORT,
+        unix_path: str | None = None,
+    ) -> "SortClient":
+        if unix_path:
+            reader, writer = await asyncio.open_unix_connection(unix_path)
+        else:
+            reader, writer = await asyncio.open_connection(host, port)
+        return cls(reader, writer)
+
+    async def close(self) -> None:
+        self.writer.close()
+        await self.writer.wait_closed()
+        self._reader_task.cancel()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        await self.close()
+
+    async def _read_responses(self) -> None:
+        try:
+            while True:
+                header = await self.reader.readexactly(RESPONSE_HEADER.size)
+                job_id, status, count = RESPONSE_HEADER.unpack(header)
+                size = count * VALUE_SIZE if status == STATUS_OK else count
+                payload = await self.reader.readexactly(size)
+                fut = self._pending.pop(job_id, None)
+                if fut is not None and not fut.done():
+                    fut.set_result((status, payload))
+        except (asyncio.IncompleteReadError, ConnectionError) as exc:
+            for fut in self._pending.values():
+                if not fut.done():
+                    fut.set_exception(SortServiceError(f"Connection lost: {exc}"))
+            self._pending.clear()
+
+    async def _request(self, op: int, algorithm: str = "", values=(), k: int = 0) -> bytes:
+        job_id = next(self._job_ids)
+        fut = asyncio.get_running_loop().create_future()
+        self._pending[job_id] = fut
+        self.writer.write(encode_request(job_id, op, algorithm, values, k))
+        await self.writer.drain()
+
+        status, payload = await fut
+        if status == STATUS_ERROR:
+            raise SortServiceError(payload.decode())
+        return payload
+
+    async def sort(self, values, algorithm: str = "merge_sort") -> array:
+        return unpack_values(await self._request(OP_SORT, algorithm, values))
+
+    async def top_k(self, values, k: int, algorithm: str = "merge_sort") -> array:
+        return unpack_values(await self._request(OP_TOP_K, algorithm, values, k))
+
+    async def stats(self) -> dict:
+        return json.loads(await self._request(OP_STATS))
+
+
+def sort_values(values, algorithm: str = "merge_sort", **connect_kwargs) -> array:
+    """Blocking one-shot helper for scripts that don't run an event loop."""
+
+    async def run():
+        async with await SortClient.connect(**connect_kwargs) as client:
+            return await client.sort(values, algorithm)
+
+    return asyncio.run(run())
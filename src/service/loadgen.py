@@ -0,0 +1,110 @@
+import argparse
+import asyncio
+import random
+import time
+from array import array
+
+from service.client import SortClient
+from service.protocol import DEFAULT_HOST, DEFAULT_PORT, percentile
+from service.server import SortServer
+
+
+def make_payloads(args: argparse.Namespace, client_index: int) -> list[array]:
+    # Generated up front so the measurement covers the service, not the RNG.
+    rng = random.Random(args.seed + client_index)
+    return [
+        array("q", (rng.randint(1, args.max_val) for _ in range(args.size)))
+        for _ in range(args.pipeline)
+    ]
+
+
+async def run_client(
+    args: argparse.Namespace,
+    payloads: list[array],
+    latencies_ms: list[float],
+) -> int:
+    values_sent = 0
+
+    async with await SortClient.connect(args.host, args.port, args.unix) as client:
+        async def one(values):
+            start = time.perf_counter()
+            if args.top_k:
+                await client.top_k(values, args.top_k, args.algorithm)
+            else:
+                await client.sort(values, args.algorithm)
+            latencies_ms.append((time.perf_counter() - start) * 1000.0)
+
+        # Rounds of `pipeline` concurrent jobs; the last round sends whatever
+        # remains so every client sends exactly args.jobs.
+        for sent in range(0, args.jobs, args.pipeline):
+            round_payloads = payloads[:args.jobs - sent]
+            await asyncio.gather(*(one(values) for values in round_payloads))
+            values_sent += args.size * len(round_payloads)
+
+    return values_sent
+
+
+async def run(args: argparse.Namespace) -> None:
+    server = None
+    if args.spawn_server:
+        server = SortServer(workers=args.workers, batch_size=args.batch_size, batch_window_ms=args.batch_window_ms)
+        await server.start(host=None if args.unix else args.host, port=args.port, unix_path=args.unix)
+
+    try:
+        payloads = [make_payloads(args, i) for i in range(args.clients)]
+        latencies_ms: list[float] = []
+        start = time.perf_counter()
+        sent = await asyncio.gather(*(run_client(args, p, latencies_ms) for p in payloads))
+        elapsed = time.perf_counter() - start
+
+        async with await SortClient.connect(args.host, args.port, args.unix) as client:
+            stats = await client.stats()
+    finally:
+        if server is not None:
+            await server.close()
+
+    latencies_ms.sort()
+    jobs = len(latencies_ms)
+    print("\n=== Load Test Results ===")
+    print(f"Algorithm: {args.algorithm} ({'top-' + str(args.top_k) if args.top_k else 'sort'})")
+    print(f"Clients: {args.clients} x {args.jobs} jobs, {args.pipeline} in flight each, n = {args.size}")
+    print(f"Elapsed: {elapsed:.2f} s")
+    print(f"Throughput: {jobs / elapsed:.1f} jobs/s, {sum(sent) / elapsed:,.0f} values/s")
+    print(
+        "Client latency: "
+        f"p50 {percentile(latencies_ms, 50):.2f} ms, "
+        f"p95 {percentile(latencies_ms, 95):.2f} ms, "
+        f"p99 {percentile(latencies_ms, 99):.2f} ms"
+    )
+    server_latency = stats["latency_ms"]
+    print(
+        f"Server: {stats['workers']} workers, {stats['batches']} batches "
+        f"(avg {stats['avg_batch_size']:.1f} jobs), queue depth {stats['queue_depth']}, "
+        f"p50 {server_latency['p50']:.2f} ms, p99 {server_latency['p99']:.2f} ms"
+    )
+
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Load generator for the local sort server")
+    parser.add_argument("--host", default=DEFAULT_HOST)
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT)
+    parser.add_argument("--unix", help="connect over this Unix socket path instead of TCP")
+    parser.add_argument("--algorithm", default="merge_sort", help="registry id or menu number")
+    parser.add_argument("--clients", type=int, default=4)
+    parser.add_argument("--jobs", type=int, default=50, help="jobs per client")
+    parser.add_argument("--pipeline", type=int, default=4, help="concurrent jobs per client connection")
+    parser.add_argument("--size", type=int, default=10_000, help="values per job")
+    parser.add_argument("--max-val", type=int, default=1_000_000)
+    parser.add_argument("--top-k", type=int, default=0, help="send top-k jobs instead of full sorts")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--spawn-server", action="store_true", help="run a server in this process for the test")
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--batch-size", type=int, default=32)
+    parser.add_argument("--batch-window-ms", type=float, default=2.0)
+    args = parser.parse_args(argv)
+    args.pipeline = max(1, min(args.pipeline, args.jobs))
+    return args
+
+
+if __name__ == "__main__":
+    asyncio.run(run(parse_args()))
@@ -0,0 +1,60 @@
+import struct
+import sys
+from array import array
+
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 8765
+
+OP_SORT = 1
+OP_TOP_K = 2
+OP_STATS = 3
+
+STATUS_OK = 0
+STATUS_ERROR = 1
+STATUS_STATS = 2
+
+# Request:  job_id, op, len(algorithm), k, count, then the algorithm name
+#           (utf-8) and `count` little-endian int64 values.
+# Response: job_id, status, count, then `count` int64 values for STATUS_OK,
+#           or `count` bytes of utf-8 text / JSON for STATUS_ERROR / STATUS_STATS.
+REQUEST_HEADER = struct.Struct("!IBHII")
+RESPONSE_HEADER = struct.Struct("!IBI")
+
+VALUE_SIZE = 8
+# Results are written back in chunks of this many values so a large job never
+# needs a second full-size copy of its payload in the server.
+CHUNK_VALUES = 64 * 1024
+# Largest request payload the server will read (128 MB of int64 values);
+# anything bigger is refused before it is buffered.
+MAX_REQUEST_VALUES = 16 * 1024 * 1024
+
+
+def pack_values(values) -> bytes:
+    if not (isinstance(values, array) and values.typecode == "q"):
+        values = array("q", values)
+    if sys.byteorder == "big":
+        values = array("q", values)
+        values.byteswap()
+    return values.tobytes()
+
+
+def unpack_values(payload: bytes) -> array:
+    values = array("q")
+    values.frombytes(payload)
+    if sys.byteorder == "big":
+        values.byteswap()
+    return values
+
+
+def encode_request(job_id: int, op: int, algorithm: str = "", values=(), k: int = 0) -> bytes:
+    name = algorithm.encode()
+    payload = pack_values(values)
+    header = REQUEST_HEADER.pack(job_id, op, len(name), k, len(payload) // VALUE_SIZE)
+    return header + name + payload
+
+
+def percentile(sorted_values: list[float], p: float) -> float | None:
+    if not sorted_values:
+        return None
+    index = min(len(sorted_values) - 1, max(0, round(p / 100.0 * (len(sorted_values) - 1))))
+    return sorted_values[index]
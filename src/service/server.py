@@ -0,0 +1,316 @@
+import argparse
+import asyncio
+import json
+import os
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+
+from service.protocol import (
+    CHUNK_VALUES,
+    DEFAULT_HOST,
+    DEFAULT_PORT,
+    MAX_REQUEST_VALUES,
+    OP_SORT,
+    OP_STATS,
+    OP_TOP_K,
+    REQUEST_HEADER,
+    RESPONSE_HEADER,
+    STATUS_ERROR,
+    STATUS_OK,
+    STATUS_STATS,
+    VALUE_SIZE,
+    pack_values,
+    percentile,
+    unpack_values,
+)
+
+
+def resolve_algorithm(name: str) -> str:
+    """Accept either a menu key from main.ALGORITHMS ("2") or a registry id ("merge_sort")."""
+    from main import ALGORITHMS
+
+    if name in ALGORITHMS:
+        return ALGORITHMS[name]["id"]
+    for info in ALGORITHMS.values():
+        if info["id"] == name:
+            return name
+    raise KeyError(f"Unknown algorithm: {name}")
+
+
+def run_batch(algo_id: str, jobs: list[tuple[int, int, bytes]]) -> list[tuple[int, bytes]]:
+    # Runs in a pool worker. Each job is (op, k, payload) and produces
+    # (status, payload) so one bad job doesn't fail the rest of its batch.
+    from algorithms.registry import available_algorithms, load_algorithm
+
+    fn = load_algorithm(algo_id)
+    # Engines that take packed buffers sort the received array in place;
+    # anything else gets a list.
+    packed = available_algorithms()[algo_id].get("buffers", False)
+    results = []
+    for op, k, payload in jobs:
+        try:
+            values = unpack_values(payload)
+            if not packed:
+                values = values.tolist()
+            result = fn(values)
+            if result is None:
+                result = values
+            if op == OP_TOP_K:
+                result = result[:k]
+            results.append((STATUS_OK, pack_values(result)))
+        except Exception as exc:
+            results.append((STATUS_ERROR, f"{type(exc).__name__}: {exc}".encode()))
+    return results
+
+
+class Job:
+    def __init__(self, job_id: int, op: int, algo_id: str, k: int, payload: bytes):
+        self.job_id = job_id
+        self.op = op
+        self.algo_id = algo_id
+        self.k = k
+        self.payload = payload
+        self.received = time.perf_counter()
+        self.future: asyncio.Future = asyncio.get_running_loop().create_future()
+
+
+class SortServer:
+    def __init__(
+        self,
+        workers: int | None = None,
+        batch_size: int = 32,
+        batch_window_ms: float = 2.0,
+        max_queue: int = 1024,
+        latency_window: int = 10_000,
+        max_request_values: int = MAX_REQUEST_VALUES,
+    ):
+        self.workers = workers or os.cpu_count() or 1
+        self.batch_size = batch_size
+        self.batch_window = batch_window_ms / 1000.0
+        self.queue: asyncio.Queue | None = None
+        self.max_queue = max_queue
+        self.max_request_values = max_request_values
+        self.pool: ProcessPoolExecutor | None = None
+        self.servers: list[asyncio.AbstractServer] = []
+        self._connections: dict[asyncio.Task, asyncio.StreamWriter] = {}
+        self._dispatcher: asyncio.Task | None = None
+
+        self.started = time.perf_counter()
+        self.jobs_completed = 0
+        self.jobs_failed = 0
+        self.values_sorted = 0
+        self.batches = 0
+        self.jobs_dispatched = 0
+        self.in_flight = 0
+        self.latencies_ms: deque = deque(maxlen=latency_window)
+
+    async def start(
+        self,
+        host: str | None = DEFAULT_HOST,
+        port: int = DEFAULT_PORT,
+        unix_path: str | None = None,
+    ) -> None:
+        self.queue = asyncio.Queue(maxsize=self.max_queue)
+        self.pool = ProcessPoolExecutor(max_workers=self.workers)
+        self._dispatcher = asyncio.create_task(self._dispatch())
+
+        if unix_path:
+            if os.path.exists(unix_path):
+                os.unlink(unix_path)
+            self.servers.append(await asyncio.start_unix_server(self._handle_client, path=unix_path))
+        if host:
+            self.servers.append(await asyncio.start_server(self._handle_client, host, port))
+
+    async def close(self) -> None:
+        for server in self.servers:
+            server.close()
+        # Closing the transports makes each handler see EOF and finish on its own.
+        for writer in self._connections.values():
+            writer.close()
+        if self._connections:
+            await asyncio.gather(*self._connections, return_exceptions=True)
+        for server in self.servers:
+            await server.wait_closed()
+        if self._dispatcher:
+            self._dispatcher.cancel()
+        if self.pool:
+            self.pool.shutdown(cancel_futures=True)
+
+    def stats(self) -> dict:
+        uptime = time.perf_counter() - self.started
+        latencies = sorted(self.latencies_ms)
+        return {
+            "uptime_s": uptime,
+            "workers": self.workers,
+            "queue_depth": self.queue.qsize() if self.queue else 0,
+            "in_flight": self.in_flight,
+            "jobs_completed": self.jobs_completed,
+            "jobs_failed": self.jobs_failed,
+            "batches": self.batches,
+            "avg_batch_size": self.jobs_dispatched / self.batches if self.batches else 0.0,
+            "values_sorted": self.values_sorted,
+            "jobs_per_s": self.jobs_completed / uptime if uptime else 0.0,
+            "values_per_s": self.values_sorted / uptime if uptime else 0.0,
+            "latency_ms": {
+                "p50": percentile(latencies, 50),
+                "p95": percentile(latencies, 95),
+                "p99": percentile(latencies, 99),
+                "max": latencies[-1] if latencies else None,
+            },
+        }
+
+    async def _dispatch(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await self.queue.get()]
+            deadline = loop.time() + self.batch_window
+            while len(batch) < self.batch_size:
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(self.queue.get(), remaining))
+                except asyncio.TimeoutError:
+                    break
+
+            by_algorithm: dict[str, list[Job]] = {}
+            for job in batch:
+                by_algorithm.setdefault(job.algo_id, []).append(job)
+
+            # Split each group so a batch never leaves idle workers behind it.
+            for algo_id, group in by_algorithm.items():
+                size = -(-len(group) // self.workers)
+                for start in range(0, len(group), size):
+                    self._submit(loop, algo_id, group[start:start + size])
+
+    def _submit(self, loop, algo_id: str, jobs: list[Job]) -> None:
+        self.batches += 1
+        self.jobs_dispatched += len(jobs)
+        self.in_flight += len(jobs)
+        work = [(job.op, job.k, job.payload) for job in jobs]
+        pending = loop.run_in_executor(self.pool, run_batch, algo_id, work)
+        pending.add_done_callback(lambda fut: self._finish_batch(jobs, fut))
+
+    def _finish_batch(self, jobs: list[Job], fut: asyncio.Future) -> None:
+        self.in_flight -= len(jobs)
+        if fut.cancelled():
+            # Still resolve every job, or its _complete task (and close()) waits forever.
+            results = [(STATUS_ERROR, b"Batch cancelled")] * len(jobs)
+        elif fut.exception() is not None:
+            results = [(STATUS_ERROR, repr(fut.exception()).encode())] * len(jobs)
+        else:
+            results = fut.result()
+        for job, result in zip(jobs, results):
+            if not job.future.done():
+                job.future.set_result(result)
+
+    async def _handle_client(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        write_lock = asyncio.Lock()
+        tasks: set[asyncio.Task] = set()
+        self._connections[asyncio.current_task()] = writer
+        try:
+            while True:
+                try:
+                    header = await reader.readexactly(REQUEST_HEADER.size)
+                    job_id, op, name_len, k, count = REQUEST_HEADER.unpack(header)
+                    name = (await reader.readexactly(name_len)).decode()
+                    if count > self.max_request_values:
+                        # The payload is never read, so the stream can't be
+                        # resynchronised: answer this job and drop the connection.
+                        message = f"Request too large: {count} values (max {self.max_request_values})"
+                        await self._respond(writer, write_lock, job_id, STATUS_ERROR, message.encode())
+                        break
+                    payload = await reader.readexactly(count * VALUE_SIZE)
+                except (asyncio.IncompleteReadError, ConnectionError):
+                    break
+
+                # Jobs on one connection are handled concurrently; responses
+                # carry the job id, so they may come back out of order.
+                if op in (OP_SORT, OP_TOP_K):
+                    try:
+                        job = Job(job_id, op, resolve_algorithm(name), k, payload)
+                    except KeyError as exc:
+                        coro = self._respond(writer, write_lock, job_id, STATUS_ERROR, str(exc).encode())
+                    else:
+                        # Waiting for queue space here stops reading from this
+                        # client, which back-pressures it when the pool is saturated.
+                        await self.queue.put(job)
+                        coro = self._complete(job, writer, write_lock)
+                elif op == OP_STATS:
+                    stats = json.dumps(self.stats()).encode()
+                    coro = self._respond(writer, write_lock, job_id, STATUS_STATS, stats)
+                else:
+                    coro = self._respond(writer, write_lock, job_id, STATUS_ERROR, f"Unknown op: {op}".encode())
+
+                task = asyncio.create_task(coro)
+                tasks.add(task)
+                task.add_done_callback(tasks.discard)
+        finally:
+            if tasks:
+                await asyncio.gather(*tasks, return_exceptions=True)
+            writer.close()
+            self._connections.pop(asyncio.current_task(), None)
+
+    async def _complete(self, job: Job, writer, write_lock) -> None:
+        status, result = await job.future
+        await self._respond(writer, write_lock, job.job_id, status, result)
+        self.latencies_ms.append((time.perf_counter() - job.received) * 1000.0)
+        if status == STATUS_OK:
+            self.jobs_completed += 1
+            self.values_sorted += len(job.payload) // VALUE_SIZE
+        else:
+            self.jobs_failed += 1
+
+    async def _respond(self, writer, write_lock, job_id: int, status: int, payload: bytes) -> None:
+        count = len(payload) // VALUE_SIZE if status == STATUS_OK else len(payload)
+        view = memoryview(payload)
+        chunk = CHUNK_VALUES * VALUE_SIZE
+        async with write_lock:
+            writer.write(RESPONSE_HEADER.pack(job_id, status, count))
+            for start in range(0, len(view), chunk):
+                writer.write(view[start:start + chunk])
+                await writer.drain()
+            await writer.drain()
+
+
+async def serve(args: argparse.Namespace) -> None:
+    server = SortServer(
+        workers=args.workers,
+        batch_size=args.batch_size,
+        batch_window_ms=args.batch_window_ms,
+        max_queue=args.max_queue,
+        max_request_values=args.max_request_values,
+    )
+    await server.start(host=None if args.unix else args.host, port=args.port, unix_path=args.unix)
+    where = args.unix or f"{args.host}:{args.port}"
+    print(f"Sort server listening on {where} with {server.workers} workers")
+    try:
+        await asyncio.Event().wait()
+    finally:
+        await server.close()
+
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Local sort service")
+    parser.add_argument("--host", default=DEFAULT_HOST)
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT)
+    parser.add_argument("--unix", help="listen on this Unix socket path instead of TCP")
+    parser.add_argument("--workers", type=int, default=None, help="worker processes (default: CPU count)")
+    parser.add_argument("--batch-size", type=int, default=32, help="max jobs sent to a worker at once")
+    parser.add_argument("--batch-window-ms", type=float, default=2.0, help="how long to wait to fill a batch")
+    parser.add_argument("--max-queue", type=int, default=1024, help="queued jobs before clients are back-pressured")
+    parser.add_argument(
+        "--max-request-values",
+        type=int,
+        default=MAX_REQUEST_VALUES,
+        help="largest job accepted, in values; bigger requests get an error",
+    )
+    return parser.parse_args(argv)
+
+
+if __name__ == "__main__":
+    try:
+        asyncio.run(serve(parse_args()))
+    except KeyboardInterrupt:
+        pass
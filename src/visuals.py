@@ -1,14 +1,26 @@
+import time
+
+# Taken before pygame is imported so the startup report covers it.
+_STARTED = time.perf_counter()
+
+import argparse
+
 import pygame
 from typing import Dict
 
-from main import ALGORITHMS, DATASETS, load_dataset, time_algorithm
-from generator.generate import (
-    generate_random_large_range,
-    sort_dataset_file,
-    generate_reverse_sorted_dataset,
-    generate_almost_sorted_dataset,
+from main import (
+    ALGORITHMS,
+    DATASETS,
+    DATASET_PARAMS,
+    DATASETS_DIR,
+    get_algorithm_fn,
+    load_dataset,
+    record_supervised,
+    startup_time_ms,
 )
 
+IMPORTS_MS = startup_time_ms(_STARTED)
+
 WIDTH, HEIGHT = 1100, 700
 BG_COLOR = (18, 18, 24)
 PANEL_COLOR = (30, 32, 40)
@@ -25,14 +37,51 @@ BUTTON_HOVER = (100, 120, 160)
 BUTTON_DISABLED = (60, 60, 70)
 
 AXIS_COLOR = (120, 125, 135)
+HISTORY_COLOR = (150, 150, 200)
+ERROR_COLOR = (255, 110, 110)
+
+# Shown in place of a time when the supervisor stopped a run.
+STATUS_LABELS = {"timeout": "Timed out", "oom": "Out of memory", "error": "Failed"}
+
+# Rendered text surfaces keyed by (font, text, color). Labels are the same from
+# frame to frame, so font.render only runs the first time each one is drawn.
+TEXT_CACHE: Dict[tuple, pygame.Surface] = {}
+TEXT_CACHE_LIMIT = 512
+
+# Surfaces for the parts of the dashboard that never change after startup.
+STATIC_LAYERS: Dict[str, pygame.Surface] = {}
+
+
+def render_text(font, text, color=TEXT_COLOR) -> pygame.Surface:
+    key = (id(font), text, color)
+    surf = TEXT_CACHE.get(key)
+    if surf is None:
+        if len(TEXT_CACHE) >= TEXT_CACHE_LIMIT:
+            TEXT_CACHE.clear()
+        surf = font.render(text, True, color)
+        TEXT_CACHE[key] = surf
+    return surf
+
+
+def static_layer(name: str, size, paint) -> pygame.Surface:
+    layer = STATIC_LAYERS.get(name)
+    if layer is None:
+        layer = pygame.Surface(size).convert()
+        paint(layer)
+        STATIC_LAYERS[name] = layer
+    return layer
+
 
 class Button:
-    def __init__(self, rect: pygame.Rect, label: str, font, callback=None):
+    def __init__(self, rect: pygame.Rect, label: str, font, callback=None, bg_color=PANEL_COLOR):
         self.rect = rect
         self.label = label
         self.font = font
         self.callback = callback
         self.enabled = True
+        # What sits behind the button, so it can be redrawn on its own.
+        self.bg_color = bg_color
+        self.hovered = False
 
     def draw(self, surface, mouse_pos):
         hovered = self.rect.collidepoint(mouse_pos) and self.enabled
@@ -40,22 +89,32 @@ class Button:
         if not self.enabled:
             color = BUTTON_DISABLED
 
+        pygame.draw.rect(surface, self.bg_color, self.rect)
         pygame.draw.rect(surface, color, self.rect, border_radius=8)
-        text_surf = self.font.render(self.label, True, TEXT_COLOR)
+        text_surf = render_text(self.font, self.label, TEXT_COLOR)
         text_rect = text_surf.get_rect(center=self.rect.center)
         surface.blit(text_surf, text_rect)
 
-    def handle_event(self, event, mouse_pos):
+    def update_hover(self, mouse_pos) -> bool:
+        # Returns True when the hover state flipped and the button needs a redraw
+        hovered = self.rect.collidepoint(mouse_pos) and self.enabled
+        changed = hovered != self.hovered
+        self.hovered = hovered
+        return changed
+
+    def handle_event(self, event, mouse_pos) -> bool:
         if not self.enabled:
-            return
+            return False
         if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
             if self.rect.collidepoint(mouse_pos):
                 if self.callback:
                     self.callback()
+                    return True
+        return False
 
 
 def draw_text(surface, text, x, y, font, color=TEXT_COLOR, center=False):
-    img = font.render(text, True, color)
+    img = render_text(font, text, color)
     rect = img.get_rect()
     if center:
         rect.center = (x, y)
@@ -64,41 +123,98 @@ def draw_text(surface, text, x, y, font, color=TEXT_COLOR, center=False):
     surface.blit(img, rect)
 
 
-def regenerate_all_datasets(max_val: int):
+def regenerate_all_datasets(max_val: int, binary: bool = False):
+    from generator.generate import (
+        format_generation_stats,
+        generate_almost_sorted_dataset,
+        generate_random_dataset,
+        generate_reverse_sorted_dataset,
+        sort_dataset_file,
+    )
+
+    ext, stale_ext = ("bin", "txt") if binary else ("txt", "bin")
+    for name in ("random", "sorted", "reversed", "almost_sorted"):
+        (DATASETS_DIR / f"{name}.{stale_ext}").unlink(missing_ok=True)
+
     print(f"Regenerating datasets (random max = {max_val})...")
-    random_path = generate_random_large_range(seed=None, max_val=max_val)
-    print(f"  Random: {random_path}")
+    stats = generate_random_dataset(seed=None, max_val=max_val, filename=f"random.{ext}")
+    DATASET_PARAMS.update(max_val=max_val, seed=stats["seed"])
+    print(f"  Random: {stats['path']}")
+    print(f"    {format_generation_stats(stats)}")
 
-    sorted_path = sort_dataset_file()
+    sorted_path = sort_dataset_file(f"random.{ext}", f"sorted.{ext}")
     print(f"  Sorted: {sorted_path}")
 
-    reversed_path = generate_reverse_sorted_dataset()
+    reversed_path = generate_reverse_sorted_dataset(f"random.{ext}", f"reversed.{ext}")
     print(f"  Reversed: {reversed_path}")
 
-    almost_sorted_path = generate_almost_sorted_dataset(seed=None)
+    almost_sorted_path = generate_almost_sorted_dataset(
+        f"random.{ext}", f"almost_sorted.{ext}", seed=stats["seed"]
+    )
     print(f"  Almost sorted: {almost_sorted_path}")
 
 
-def run_benchmarks_for_algorithm(algo_key: str) -> Dict[str, float]:
+def run_benchmarks_for_algorithm(
+    algo_key: str,
+    profile: bool = False,
+    profile_top: int = 10,
+    packed: bool = False,
+    time_limit_s: float | None = None,
+    memory_limit_mb: float | None = None,
+) -> Dict[str, float | str]:
+    # Each dataset runs under the supervisor; a run that is stopped gets a
+    # status label instead of a time and the sweep carries on.
+    from benchmark.supervisor import describe_failure, run_supervised
+
     algo_info = ALGORITHMS[algo_key]
-    algo_fn = algo_info["fn"]
 
-    results: Dict[str, float] = {}
+    results: Dict[str, float | str] = {}
     for ds_key, ds_info in DATASETS.items():
-        nums = load_dataset(ds_info["filename"])
         print(f"Running {algo_info['name']} on {ds_info['name']}...")
-        _, time_ms = time_algorithm(algo_fn, nums)
-        results[ds_key] = time_ms
+        result = run_supervised(
+            algo_key,
+            ds_key,
+            packed=packed,
+            time_limit_s=time_limit_s,
+            memory_limit_mb=memory_limit_mb,
+        )
+        record_supervised(algo_key, ds_key, result)
+
+        if result["status"] != "ok":
+            print(f"  {describe_failure(result)}")
+            results[ds_key] = STATUS_LABELS.get(result["status"], "Failed")
+            continue
+        results[ds_key] = result["time_ms"]
+
+        if profile:
+            from profiling.hotpath import print_hot_functions, profile_run
+
+            nums = load_dataset(ds_info["filename"], packed=packed and algo_info.get("buffers", False))
+            label = f"{algo_info['id']}_{ds_info['filename'].rsplit('.', 1)[0]}"
+            print_hot_functions(profile_run(get_algorithm_fn(algo_key), nums, label, top_n=profile_top))
 
     return results
 
 
-def draw_top_bar(screen, algo_buttons, selected_algo_key, mouse_pos, title_font, small_font):
-    pygame.draw.rect(screen, PANEL_COLOR, pygame.Rect(0, 0, WIDTH, 90))
+def load_history(algo_key: str) -> list[Dict[str, float]]:
+    # Historical means from previous sessions, re-keyed by dataset menu key.
+    from results.store import history_for_algorithm
+
+    keys_by_name = {info["name"]: key for key, info in DATASETS.items()}
+    history = []
+    for _, by_dataset in history_for_algorithm(ALGORITHMS[algo_key]["id"]):
+        history.append({
+            keys_by_name[name]: t_ms for name, t_ms in by_dataset.items() if name in keys_by_name
+        })
+    return history
 
-    draw_text(screen, "Sorting Algorithm Demo", 30, 20, title_font)
+
+def paint_top_bar(surface, title_font, small_font):
+    surface.fill(PANEL_COLOR)
+
+    draw_text(surface, "Sorting Algorithm Demo", 30, 20, title_font)
     draw_text(
-        screen,
+        surface,
         "Select an algorithm, then compare its performance across datasets.",
         30,
         50,
@@ -106,6 +222,11 @@ def draw_top_bar(screen, algo_buttons, selected_algo_key, mouse_pos, title_font,
         color=MUTED_TEXT,
     )
 
+
+def draw_top_bar(screen, algo_buttons, selected_algo_key, mouse_pos, title_font, small_font):
+    layer = static_layer("top_bar", (WIDTH, 90), lambda s: paint_top_bar(s, title_font, small_font))
+    screen.blit(layer, (0, 0))
+
     for key, button in algo_buttons.items():
         button.draw(screen, mouse_pos)
 
@@ -120,36 +241,71 @@ def draw_top_bar(screen, algo_buttons, selected_algo_key, mouse_pos, title_font,
         )
 
 
-def draw_dataset_panel(screen, dataset_results: Dict[str, float], medium_font, small_font):
-    panel_rect = pygame.Rect(WIDTH - 320, 90, 320, HEIGHT - 90)
-    pygame.draw.rect(screen, PANEL_COLOR, panel_rect)
+DATASET_PANEL_RECT = pygame.Rect(WIDTH - 320, 90, 320, HEIGHT - 90)
+
 
+def dataset_card_rects() -> Dict[str, pygame.Rect]:
     margin = 16
-    x = panel_rect.x + margin
-    y = panel_rect.y + margin
+    card_height = 90
+    gap = 12
 
-    draw_text(screen, "Datasets", x, y, medium_font)
+    x = DATASET_PANEL_RECT.x + margin
+    y = DATASET_PANEL_RECT.y + margin + 100
+    rects = {}
+    for key in DATASETS:
+        rects[key] = pygame.Rect(x, y, DATASET_PANEL_RECT.width - 2 * margin, card_height)
+        y += card_height + gap
+    return rects
+
+
+def paint_dataset_panel(surface, medium_font, small_font):
+    # Everything in the panel except the per-run times, in panel coordinates
+    surface.fill(PANEL_COLOR)
+    offset_x, offset_y = DATASET_PANEL_RECT.topleft
+
+    margin = 16
+    x = margin
+    y = margin
+
+    draw_text(surface, "Datasets", x, y, medium_font)
     y += 30
-    draw_text(screen, "Each bar in the chart represents", x, y, small_font, color=MUTED_TEXT)
+    draw_text(surface, "Each bar in the chart represents", x, y, small_font, color=MUTED_TEXT)
     y += 20
-    draw_text(screen, "the time for this algorithm on", x, y, small_font, color=MUTED_TEXT)
+    draw_text(surface, "the time for this algorithm on", x, y, small_font, color=MUTED_TEXT)
     y += 20
-    draw_text(screen, "each dataset.", x, y, small_font, color=MUTED_TEXT)
-    y += 30
-
-    card_height = 90
-    gap = 12
+    draw_text(surface, "each dataset.", x, y, small_font, color=MUTED_TEXT)
 
-    for key, info in DATASETS.items():
-        rect = pygame.Rect(x, y, panel_rect.width - 2 * margin, card_height)
-        pygame.draw.rect(screen, CARD_COLOR, rect, border_radius=10)
+    for key, card in dataset_card_rects().items():
+        info = DATASETS[key]
+        rect = card.move(-offset_x, -offset_y)
+        pygame.draw.rect(surface, CARD_COLOR, rect, border_radius=10)
 
-        draw_text(screen, info["name"], rect.x + 10, rect.y + 8, small_font)
+        draw_text(surface, info["name"], rect.x + 10, rect.y + 8, small_font)
 
         desc = info["description"]
-        draw_text(screen, desc, rect.x + 10, rect.y + 30, small_font, color=MUTED_TEXT)
+        draw_text(surface, desc, rect.x + 10, rect.y + 30, small_font, color=MUTED_TEXT)
 
-        if dataset_results and key in dataset_results:
+
+def draw_dataset_panel(screen, dataset_results: Dict[str, float | str], medium_font, small_font):
+    layer = static_layer(
+        "dataset_panel",
+        DATASET_PANEL_RECT.size,
+        lambda s: paint_dataset_panel(s, medium_font, small_font),
+    )
+    screen.blit(layer, DATASET_PANEL_RECT)
+
+    for key, rect in dataset_card_rects().items():
+        if dataset_results and isinstance(dataset_results.get(key), str):
+            draw_text(
+                screen,
+                dataset_results[key],
+                rect.right - 180,
+                rect.bottom - 25,
+                small_font,
+                color=ERROR_COLOR,
+                center=False,
+            )
+        elif dataset_results and key in dataset_results:
             t_ms = dataset_results[key]
             time_str = f"{t_ms:.1f} ms"
             draw_text(
@@ -172,17 +328,16 @@ def draw_dataset_panel(screen, dataset_results: Dict[str, float], medium_font, s
                 center=False,
             )
 
-        y += card_height + gap
-
 
 def draw_bar_chart(
     screen,
     selected_algo_key,
-    dataset_results: Dict[str, float],
+    dataset_results: Dict[str, float | str],
     chart_rect: pygame.Rect,
     large_font,
     small_font,
     datasets_regenerated: bool,
+    history: list[Dict[str, float]] | None = None,
 ):
     pygame.draw.rect(screen, PANEL_COLOR, chart_rect, border_radius=10)
 
@@ -252,11 +407,13 @@ def draw_bar_chart(
     pygame.draw.line(screen, AXIS_COLOR, (x0, y1), (x1, y1), 2)
 
     ds_keys = list(DATASETS.keys())
-    times = [dataset_results[k] for k in ds_keys if k in dataset_results]
-    if not times:
-        return
+    times = [dataset_results[k] for k in ds_keys if isinstance(dataset_results.get(k), float)]
+
+    history = history or []
+    for past in history:
+        times.extend(past.values())
 
-    max_time = max(times)
+    max_time = max(times, default=1.0)
     if max_time <= 0:
         max_time = 1.0
 
@@ -270,6 +427,9 @@ def draw_bar_chart(
     for i, ds_key in enumerate(ds_keys):
         ds_info = DATASETS[ds_key]
         t_ms = dataset_results.get(ds_key, 0.0)
+        status = t_ms if isinstance(t_ms, str) else None
+        if status is not None:
+            t_ms = 0.0
 
         height_ratio = t_ms / max_time if max_time > 0 else 0
         bar_h = height_ratio * chart_height
@@ -278,18 +438,37 @@ def draw_bar_chart(
         x = cx - bar_width / 2
         y = y1 - bar_h
 
-        rect = pygame.Rect(x, y, bar_width, bar_h)
-        pygame.draw.rect(screen, BAR_COLOR, rect, border_radius=4)
-        pygame.draw.rect(screen, BAR_OUTLINE, rect, width=1, border_radius=4)
+        if status is None:
+            rect = pygame.Rect(x, y, bar_width, bar_h)
+            pygame.draw.rect(screen, BAR_COLOR, rect, border_radius=4)
+            pygame.draw.rect(screen, BAR_OUTLINE, rect, width=1, border_radius=4)
+
+        # Previous sessions are drawn as ticks across the bar, oldest faintest.
+        for age, past in enumerate(reversed(history)):
+            if ds_key not in past:
+                continue
+            hy = y1 - (past[ds_key] / max_time) * chart_height
+            fade = 1.0 - 0.15 * age
+            color = tuple(int(c * fade) for c in HISTORY_COLOR)
+            pygame.draw.line(screen, color, (x - 6, hy), (x + bar_width + 6, hy), 2)
 
         label = ds_info["name"]
         draw_text(screen, label, cx, y1 + 8, small_font, color=MUTED_TEXT, center=True)
 
-        label_time = f"{t_ms:.0f} ms"
-        draw_text(screen, label_time, cx, y - 18, small_font, color=ACCENT_COLOR, center=True)
+        if status is not None:
+            draw_text(screen, status, cx, y1 - 18, small_font, color=ERROR_COLOR, center=True)
+        else:
+            label_time = f"{t_ms:.0f} ms"
+            draw_text(screen, label_time, cx, y - 18, small_font, color=ACCENT_COLOR, center=True)
 
 
-def main():
+def main(
+    profile: bool = False,
+    profile_top: int = 10,
+    packed: bool = False,
+    time_limit: float | None = None,
+    memory_limit: float | None = None,
+):
     pygame.init()
     screen = pygame.display.set_mode((WIDTH, HEIGHT))
     pygame.display.set_caption("Sorting Algorithm Visualization Demo")
@@ -303,10 +482,11 @@ def main():
     max_random_value = 1000
     datasets_regenerated = False
 
-    regenerate_all_datasets(max_random_value)
+    regenerate_all_datasets(max_random_value, packed)
 
     selected_algo_key = None
-    dataset_results: Dict[str, float] = {}
+    dataset_results: Dict[str, float | str] = {}
+    history: list[Dict[str, float]] = []
 
     algo_buttons: Dict[str, Button] = {}
     btn_width = 170
@@ -322,24 +502,28 @@ def main():
 
         def make_callback(k=key):
             def callback():
-                nonlocal selected_algo_key, dataset_results
+                nonlocal selected_algo_key, dataset_results, history
                 selected_algo_key = k
-                dataset_results = run_benchmarks_for_algorithm(k)
+                dataset_results = run_benchmarks_for_algorithm(
+                    k, profile, profile_top, packed, time_limit, memory_limit
+                )
+                history = load_history(k)
             return callback
 
         algo_buttons[key] = Button(rect, info["name"], small_font, callback=make_callback())
 
     regen_rect = pygame.Rect(30, HEIGHT - 60, 220, 40)
-    regen_button = Button(regen_rect, "Regenerate Datasets", small_font)
+    regen_button = Button(regen_rect, "Regenerate Datasets", small_font, bg_color=BG_COLOR)
 
     max_value_box_rect = pygame.Rect(regen_rect.right + 230, regen_rect.y, 80, regen_rect.height)
     max_dec_rect = pygame.Rect(max_value_box_rect.x - 40, regen_rect.y, 30, regen_rect.height)
     max_inc_rect = pygame.Rect(max_value_box_rect.right + 10, regen_rect.y, 30, regen_rect.height)
 
     def regen_callback():
-        nonlocal dataset_results, selected_algo_key, datasets_regenerated
-        regenerate_all_datasets(max_random_value)
+        nonlocal dataset_results, selected_algo_key, datasets_regenerated, history
+        regenerate_all_datasets(max_random_value, packed)
         dataset_results = {}
+        history = []
         selected_algo_key = None
         datasets_regenerated = True
 
@@ -357,33 +541,17 @@ def main():
             max_random_value = min(1_000_000, max_random_value + 1000)
             print(f"Random max increased to {max_random_value}")
 
-    max_dec_button = Button(max_dec_rect, "-", small_font, callback=dec_max_callback)
-    max_inc_button = Button(max_inc_rect, "+", small_font, callback=inc_max_callback)
-
-    running = True
-    while running:
-        mouse_pos = pygame.mouse.get_pos()
-
-        for event in pygame.event.get():
-            if event.type == pygame.QUIT:
-                running = False
-
-            elif event.type == pygame.KEYDOWN:
-                if event.key == pygame.K_ESCAPE:
-                    running = False
-
-            for button in algo_buttons.values():
-                button.handle_event(event, mouse_pos)
-            regen_button.handle_event(event, mouse_pos)
-            max_dec_button.handle_event(event, mouse_pos)
-            max_inc_button.handle_event(event, mouse_pos)
+    max_dec_button = Button(max_dec_rect, "-", small_font, callback=dec_max_callback, bg_color=BG_COLOR)
+    max_inc_button = Button(max_inc_rect, "+", small_font, callback=inc_max_callback, bg_color=BG_COLOR)
+    buttons = [*algo_buttons.values(), regen_button, max_dec_button, max_inc_button]
 
+    def draw_dashboard(mouse_pos):
         screen.fill(BG_COLOR)
 
         draw_top_bar(screen, algo_buttons, selected_algo_key, mouse_pos, title_font, small_font)
 
         chart_rect = pygame.Rect(30, 110, WIDTH - 380, HEIGHT - 180)
-        draw_bar_chart(screen, selected_algo_key, dataset_results, chart_rect, medium_font, small_font, datasets_regenerated)
+        draw_bar_chart(screen, selected_algo_key, dataset_results, chart_rect, medium_font, small_font, datasets_regenerated, history)
 
         draw_dataset_panel(screen, dataset_results, medium_font, small_font)
 
@@ -394,7 +562,7 @@ def main():
 
         pygame.draw.rect(screen, CARD_COLOR, max_value_box_rect, border_radius=8)
         value_str = str(max_random_value)
-        value_surf = small_font.render(value_str, True, TEXT_COLOR)
+        value_surf = render_text(small_font, value_str, TEXT_COLOR)
         value_rect = value_surf.get_rect(center=max_value_box_rect.center)
         screen.blit(value_surf, value_rect)
 
@@ -402,17 +570,83 @@ def main():
         max_inc_button.draw(screen, mouse_pos)
 
         esc_text = "ESC to quit"
-        esc_surf = small_font.render(esc_text, True, MUTED_TEXT)
+        esc_surf = render_text(small_font, esc_text, MUTED_TEXT)
         esc_rect = esc_surf.get_rect()
         esc_rect.bottom = regen_rect.bottom
         esc_rect.right = WIDTH - 40
         screen.blit(esc_surf, esc_rect)
 
-        pygame.display.flip()
+    # Only what the user can see change gets redrawn: clicks that change state
+    # (and window exposes) repaint the dashboard, hover changes repaint just
+    # the affected buttons, and otherwise nothing is drawn at all.
+    redraw_events = {pygame.WINDOWEXPOSED, pygame.WINDOWRESTORED, pygame.WINDOWSIZECHANGED}
+    pygame.event.set_blocked(None)
+    pygame.event.set_allowed([
+        pygame.QUIT,
+        pygame.KEYDOWN,
+        pygame.MOUSEMOTION,
+        pygame.MOUSEBUTTONDOWN,
+        pygame.WINDOWLEAVE,
+        *redraw_events,
+    ])
+
+    full_redraw = True
+    first_frame = True
+    running = True
+    while running:
+        # Block until there is input, so an idle dashboard uses no CPU and
+        # doesn't perturb benchmarks running next to it.
+        events = [] if full_redraw else [pygame.event.wait()]
+        events.extend(pygame.event.get())
+        mouse_pos = pygame.mouse.get_pos() if pygame.mouse.get_focused() else (-1, -1)
+
+        for event in events:
+            if event.type == pygame.QUIT:
+                running = False
+
+            elif event.type == pygame.KEYDOWN:
+                if event.key == pygame.K_ESCAPE:
+                    running = False
+
+            elif event.type in redraw_events:
+                full_redraw = True
+
+            for button in buttons:
+                if button.handle_event(event, mouse_pos):
+                    full_redraw = True
+
+        hover_changed = [button for button in buttons if button.update_hover(mouse_pos)]
+
+        if full_redraw:
+            draw_dashboard(mouse_pos)
+            pygame.display.flip()
+            full_redraw = False
+            if first_frame:
+                first_frame = False
+                print(f"UI ready: imports {IMPORTS_MS:.1f} ms, first frame {startup_time_ms(_STARTED):.1f} ms")
+        elif hover_changed:
+            for button in hover_changed:
+                button.draw(screen, mouse_pos)
+            pygame.display.update([button.rect for button in hover_changed])
+
+        # Caps redraws during bursts of mouse motion; idle time is spent in event.wait()
         clock.tick(60)
 
     pygame.quit()
 
 
 if __name__ == "__main__":
-    main()
+    parser = argparse.ArgumentParser(description="Sorting Algorithm Visualization Demo")
+    parser.add_argument("--profile", action="store_true", help="profile each benchmark after timing it")
+    parser.add_argument("--profile-top", type=int, default=10)
+    parser.add_argument("--packed", action="store_true", help="benchmark on packed 64-bit arrays instead of lists")
+    parser.add_argument("--time-limit", type=float, default=None, metavar="SECONDS", help="stop a run after this long")
+    parser.add_argument("--memory-limit", type=float, default=None, metavar="MB", help="stop a run that grows past this")
+    args = parser.parse_args()
+    main(
+        profile=args.profile,
+        profile_top=args.profile_top,
+        packed=args.packed,
+        time_limit=args.time_limit,
+        memory_limit=args.memory_limit,
+    )